@@ -33,6 +33,16 @@ import json
 import sys
 import time
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _err(text: str) -> None:
+    """Write text to the current sys.stderr (looked up per call, so redirection works)."""
+    sys.stderr.write(text)
+
 # Add src to path
 sys.path.insert(0, '.')
 
@@ -48,12 +58,18 @@ from src.core import (
 
 
 def main():
+    # CLI is English-only: bypass gettext lookups argparse makes per subparser
+    argparse._ = lambda s: s
+    argparse.ngettext = lambda s, p, n: s if n == 1 else p
+
     parser = argparse.ArgumentParser(
         prog="gov-os",
         description="Gov-OS: Universal Federal Fraud Detection Operating System",
-        epilog=f"\n{DISCLAIMER}",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+        allow_abbrev=False,
     )
+    # Help formatting is only needed when help is actually rendered
+    if any(a in ('-h', '--help') for a in sys.argv[1:]):
+        _enable_help_formatting(parser)
 
     parser.add_argument(
         '--test',
@@ -170,6 +186,14 @@ def main():
     # shieldproof test
     shieldproof_test = shieldproof_sub.add_parser('test', help='Run self-test')
 
+    # shieldproof receipt
+    sp_receipt = shieldproof_sub.add_parser('receipt', help='Emit a receipt')
+    sp_receipt.add_argument('type', help='Receipt type')
+    sp_receipt.add_argument('--data', default='{}', help='Receipt fields as JSON')
+    sp_receipt.add_argument('--format', choices=['json', 'cbor'], default='json',
+                            help='Stdout encoding (default: json)')
+    sp_receipt.add_argument('--no-ledger', action='store_true', help='Do not append to ledger')
+
     # shieldproof contract
     shieldproof_contract = shieldproof_sub.add_parser('contract', help='Contract operations')
     shieldproof_contract_sub = shieldproof_contract.add_subparsers(dest='contract_action')
@@ -245,50 +269,22 @@ def main():
     if args.test:
         return cmd_test()
 
-    if args.command == 'scenario':
-        return cmd_scenario(args.run, args.cycles, args.verbose)
-
-    if args.command == 'export':
-        return cmd_export(args.scenario, args.format, args.include_citations)
-
-    if args.command == 'explain':
-        return cmd_explain(args.file, args.demo)
-
-    if args.command == 'health':
-        return cmd_health(args.detailed)
-
-    if args.command == 'patterns':
-        return cmd_patterns(args.list, args.check, args.domain)
-
-    if args.command == 'freshness':
-        return cmd_freshness(args.check, args.demo)
-
-    if args.command == 'defense':
-        return cmd_domain('defense', args)
-
-    if args.command == 'medicaid':
-        return cmd_domain('medicaid', args)
-
-    if args.command == 'razor':
-        return cmd_razor(args)
-
-    if args.command == 'shipyard':
-        return cmd_shipyard(args)
-
-    if args.command == 'shieldproof':
-        return cmd_shieldproof(args)
-
-    if args.command == 'validate':
-        return cmd_validate(args.domain)
-
-    if args.command == 'list':
-        return cmd_list(args.what, args.domain)
+    handler = COMMANDS.get(args.command)
+    if handler is not None:
+        return handler(args)
 
     # Default: show help
+    _enable_help_formatting(parser)
     parser.print_help()
     return 0
 
 
+def _enable_help_formatting(parser: argparse.ArgumentParser) -> None:
+    """Attach the raw-description formatter and disclaimer epilog."""
+    parser.formatter_class = argparse.RawDescriptionHelpFormatter
+    parser.epilog = f"\n{DISCLAIMER}"
+
+
 # =============================================================================
 # COMMAND IMPLEMENTATIONS
 # =============================================================================
@@ -877,45 +873,70 @@ def cmd_shieldproof(args):
         run_baseline_scenario,
         run_stress_scenario,
         clear_ledger,
+        set_stdout_default,
     )
 
-    print("=" * 60, file=sys.stderr)
-    print(f"SHIELDPROOF v{SP_VERSION} - Defense Contract Accountability", file=sys.stderr)
-    print('"One receipt. One milestone. One truth."', file=sys.stderr)
-    print("=" * 60, file=sys.stderr)
+    # Interactive use prints every receipt, including nested ones
+    set_stdout_default(True)
+
+    _err("=" * 60 + "\n")
+    _err(f"SHIELDPROOF v{SP_VERSION} - Defense Contract Accountability\n")
+    _err('"One receipt. One milestone. One truth."\n')
+    _err("=" * 60 + "\n")
 
     if not args.action:
-        print("Available actions: test, contract, milestone, payment, reconcile, dashboard, scenario", file=sys.stderr)
+        _err("Available actions: test, receipt, contract, milestone, payment, reconcile, dashboard, scenario\n")
         return 0
 
     # Test
     if args.action == 'test':
         h = sp_dual_hash("test")
         assert ":" in h, "dual_hash must return SHA256:BLAKE3 format"
-        print(f"dual_hash: OK ({h[:32]}...)", file=sys.stderr)
-        r = sp_emit_receipt("test", {"message": "ShieldProof self-test"}, to_ledger=False)
-        print(f"emit_receipt: OK", file=sys.stderr)
-        print(f"\n[PASS] ShieldProof v{SP_VERSION} operational", file=sys.stderr)
+        _err(f"dual_hash: OK ({h[:32]}...)\n")
+        r = sp_emit_receipt(
+            "test", {"message": "ShieldProof self-test"}, to_stdout=True, to_ledger=False
+        )
+        _err(f"emit_receipt: OK\n")
+        _err(f"\n[PASS] ShieldProof v{SP_VERSION} operational\n")
+        return 0
+
+    # Receipt
+    if args.action == 'receipt':
+        try:
+            data = json.loads(args.data)
+        except json.JSONDecodeError as e:
+            _err(f"Error: Invalid data JSON: {e}\n")
+            return 1
+        try:
+            sp_emit_receipt(
+                args.type, data, to_stdout=True, to_ledger=not args.no_ledger, format=args.format
+            )
+        except Exception as e:
+            _err(f"Error: {e}\n")
+            return 1
         return 0
 
     # Contract
     if args.action == 'contract':
         if not hasattr(args, 'contract_action') or not args.contract_action:
-            print("Usage: gov-os shieldproof contract {register,list}", file=sys.stderr)
+            _err("Usage: gov-os shieldproof contract {register,list}\n")
             return 1
 
         if args.contract_action == 'register':
             try:
                 milestones = json.loads(args.milestones)
             except json.JSONDecodeError as e:
-                print(f"Error: Invalid milestones JSON: {e}", file=sys.stderr)
+                _err(f"Error: Invalid milestones JSON: {e}\n")
                 return 1
             terms = {}
             if args.terms:
-                try:
-                    terms = json.loads(args.terms)
-                except json.JSONDecodeError:
-                    terms = {"raw": args.terms}
+                # Plain-text terms are the common case; only parse JSON-looking input
+                terms = {"raw": args.terms}
+                if args.terms.lstrip().startswith(('{', '[')):
+                    try:
+                        terms = json.loads(args.terms)
+                    except json.JSONDecodeError:
+                        pass
             try:
                 receipt = register_contract(
                     contractor=args.contractor,
@@ -924,16 +945,16 @@ def cmd_shieldproof(args):
                     terms=terms,
                     contract_id=getattr(args, 'id', None),
                 )
-                print(f"Contract registered: {receipt['contract_id']}", file=sys.stderr)
+                _err(f"Contract registered: {receipt['contract_id']}\n")
             except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
+                _err(f"Error: {e}\n")
                 return 1
             return 0
 
         if args.contract_action == 'list':
             contracts = list_contracts()
             if not contracts:
-                print("No contracts found.", file=sys.stderr)
+                _err("No contracts found.\n")
             for c in contracts:
                 amount = c.get('amount_fixed', c.get('total_value_usd', 0))
                 print(f"{c.get('contract_id')}: {c.get('contractor')} - ${amount:,.2f}")
@@ -942,7 +963,7 @@ def cmd_shieldproof(args):
     # Milestone
     if args.action == 'milestone':
         if not hasattr(args, 'milestone_action') or not args.milestone_action:
-            print("Usage: gov-os shieldproof milestone {add,verify}", file=sys.stderr)
+            _err("Usage: gov-os shieldproof milestone {add,verify}\n")
             return 1
 
         if args.milestone_action == 'add':
@@ -950,10 +971,10 @@ def cmd_shieldproof(args):
             milestone_id = getattr(args, 'milestone_id', None)
             deliverable = getattr(args, 'deliverable', 'Deliverable') or 'Deliverable'
             try:
-                receipt = submit_deliverable(contract_id, milestone_id, deliverable.encode())
-                print(f"Deliverable submitted: {receipt['milestone_id']} -> {receipt['status']}", file=sys.stderr)
+                receipt = submit_deliverable(contract_id, milestone_id, deliverable)
+                _err(f"Deliverable submitted: {receipt['milestone_id']} -> {receipt['status']}\n")
             except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
+                _err(f"Error: {e}\n")
                 return 1
             return 0
 
@@ -964,16 +985,16 @@ def cmd_shieldproof(args):
             reject = getattr(args, 'reject', False)
             try:
                 receipt = verify_milestone(contract_id, milestone_id, verifier_id, passed=not reject)
-                print(f"Milestone {receipt['milestone_id']} -> {receipt['status']}", file=sys.stderr)
+                _err(f"Milestone {receipt['milestone_id']} -> {receipt['status']}\n")
             except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
+                _err(f"Error: {e}\n")
                 return 1
             return 0
 
     # Payment
     if args.action == 'payment':
         if not hasattr(args, 'payment_action') or not args.payment_action:
-            print("Usage: gov-os shieldproof payment {release,list}", file=sys.stderr)
+            _err("Usage: gov-os shieldproof payment {release,list}\n")
             return 1
 
         if args.payment_action == 'release':
@@ -982,9 +1003,9 @@ def cmd_shieldproof(args):
             try:
                 receipt = release_payment(contract_id, milestone_id)
                 amount = receipt.get('amount', receipt.get('amount_usd', 0))
-                print(f"Payment released: ${amount:,.2f}", file=sys.stderr)
+                _err(f"Payment released: ${amount:,.2f}\n")
             except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
+                _err(f"Error: {e}\n")
                 return 1
             return 0
 
@@ -992,7 +1013,7 @@ def cmd_shieldproof(args):
             contract_id = getattr(args, 'contract_id', None)
             payments = list_payments(contract_id)
             if not payments:
-                print("No payments found.", file=sys.stderr)
+                _err("No payments found.\n")
             for p in payments:
                 amount = p.get('amount', p.get('amount_usd', 0))
                 print(f"{p.get('contract_id')}/{p.get('milestone_id')}: ${amount:,.2f}")
@@ -1001,7 +1022,7 @@ def cmd_shieldproof(args):
     # Reconcile
     if args.action == 'reconcile':
         if not hasattr(args, 'reconcile_action') or not args.reconcile_action:
-            print("Usage: gov-os shieldproof reconcile {check,report}", file=sys.stderr)
+            _err("Usage: gov-os shieldproof reconcile {check,report}\n")
             return 1
 
         if args.reconcile_action == 'check':
@@ -1013,14 +1034,26 @@ def cmd_shieldproof(args):
         if args.reconcile_action == 'report':
             reports = reconcile_all()
             summary = get_waste_summary()
-            output = {"summary": summary, "contracts": reports}
-            print(json.dumps(output, indent=2))
+            if HAS_ORJSON:
+                # Stream the two halves straight to the byte buffer rather
+                # than wrapping them in one dict for json.dumps to walk.
+                sys.stdout.flush()
+                out = sys.stdout.buffer
+                out.write(b'{\n  "summary": ')
+                out.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+                out.write(b',\n  "contracts": ')
+                out.write(orjson.dumps(reports, option=orjson.OPT_INDENT_2))
+                out.write(b'\n}\n')
+                out.flush()
+            else:
+                output = {"summary": summary, "contracts": reports}
+                print(json.dumps(output, indent=2))
             return 0
 
     # Dashboard
     if args.action == 'dashboard':
         if not hasattr(args, 'dashboard_action') or not args.dashboard_action:
-            print("Usage: gov-os shieldproof dashboard {export,summary}", file=sys.stderr)
+            _err("Usage: gov-os shieldproof dashboard {export,summary}\n")
             return 1
 
         if args.dashboard_action == 'export':
@@ -1028,9 +1061,9 @@ def cmd_shieldproof(args):
             output = getattr(args, 'output', f'/tmp/dashboard.{fmt}')
             try:
                 export_dashboard(fmt, output)
-                print(f"Exported to {output}", file=sys.stderr)
+                _err(f"Exported to {output}\n")
             except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
+                _err(f"Error: {e}\n")
                 return 1
             return 0
 
@@ -1042,7 +1075,7 @@ def cmd_shieldproof(args):
     # Scenario
     if args.action == 'scenario':
         if not hasattr(args, 'scenario_action') or args.scenario_action != 'run':
-            print("Usage: gov-os shieldproof scenario run {baseline,stress}", file=sys.stderr)
+            _err("Usage: gov-os shieldproof scenario run {baseline,stress}\n")
             return 1
 
         scenario = getattr(args, 'scenario', 'baseline')
@@ -1053,13 +1086,13 @@ def cmd_shieldproof(args):
         elif scenario == 'stress':
             result = run_stress_scenario(n_contracts=n_contracts)
         else:
-            print(f"Unknown scenario: {scenario}", file=sys.stderr)
+            _err(f"Unknown scenario: {scenario}\n")
             return 1
 
         print(json.dumps(result, indent=2, default=str))
         return 0 if result.get('passed') else 1
 
-    print(f"Unknown action: {args.action}", file=sys.stderr)
+    _err(f"Unknown action: {args.action}\n")
     return 1
 
 
@@ -1131,5 +1164,23 @@ def cmd_list(what: str, domain: str):
     return 0
 
 
+# Subcommand dispatch: one dict lookup instead of an if-chain
+COMMANDS = {
+    'scenario': lambda a: cmd_scenario(a.run, a.cycles, a.verbose),
+    'export': lambda a: cmd_export(a.scenario, a.format, a.include_citations),
+    'explain': lambda a: cmd_explain(a.file, a.demo),
+    'health': lambda a: cmd_health(a.detailed),
+    'patterns': lambda a: cmd_patterns(a.list, a.check, a.domain),
+    'freshness': lambda a: cmd_freshness(a.check, a.demo),
+    'defense': lambda a: cmd_domain('defense', a),
+    'medicaid': lambda a: cmd_domain('medicaid', a),
+    'razor': cmd_razor,
+    'shipyard': cmd_shipyard,
+    'shieldproof': cmd_shieldproof,
+    'validate': lambda a: cmd_validate(a.domain),
+    'list': lambda a: cmd_list(a.what, a.domain),
+}
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -92,6 +92,7 @@ from .constants import (
 
 from .utils import (
     dual_hash,
+    canonical_json,
     merkle,
     cite,
     generate_receipt_id,
@@ -166,6 +167,7 @@ from .foreignaid_etl import (
     ForeignAidETL,
     ForeignAidAward,
     ImplementingPartner,
+    ImplementingPartnerFrame,
     RoundTripEvidence,
     get_available_agencies,
     get_foreignaid_cohorts,
@@ -220,6 +222,7 @@ __all__ = [
     "CITATIONS",
     # Utilities
     "dual_hash",
+    "canonical_json",
     "merkle",
     "cite",
     "generate_receipt_id",
@@ -286,6 +289,7 @@ __all__ = [
     "ForeignAidETL",
     "ForeignAidAward",
     "ImplementingPartner",
+    "ImplementingPartnerFrame",
     "RoundTripEvidence",
     "get_available_agencies",
     "get_foreignaid_cohorts",
@@ -17,16 +17,14 @@ v5.1 Temporal Physics Constants:
 - ENTROPY_RESISTANCE_MULTIPLIER: Sensitivity boost from resistance metric
 """
 
+import importlib.util
 import math
 import os
 from pathlib import Path
 from typing import Optional
 
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+# yaml is only needed by _load_compression_config; import it there
+HAS_YAML = importlib.util.find_spec("yaml") is not None
 
 try:
     import numpy as np
@@ -280,6 +278,7 @@ def _load_compression_config() -> dict:
         return _compression_config_cache
 
     try:
+        import yaml
         with open(config_path, 'r') as f:
             _compression_config_cache = yaml.safe_load(f) or {}
     except Exception:
@@ -19,17 +19,41 @@ Receipts Emitted:
 - cross_reference_receipt: Documents FEC/990 cross-reference
 """
 
+import bisect
+import hashlib
 import json
-from dataclasses import dataclass, field
+import random
+import re
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 from .constants import (
     TENANT_ID,
     DISCLAIMER,
 )
-from .utils import dual_hash
+from .utils import canonical_json, dual_hash
 from .receipt import emit_receipt
 
 
@@ -46,12 +70,79 @@ DATA_SOURCES = {
 
 SUPPORTED_AGENCIES = ["USAID", "STATE", "MCC", "PEACE_CORPS", "TDA", "USTDA"]
 
+# Awards drawn per chunk by fetch_awards_stream
+AWARD_STREAM_CHUNK = 4096
+
+# Simulated implementing partners: (name, EIN, DUNS)
+_NGOS = (
+    ("Democracy International", "52-1234567", "123456789"),
+    ("International Republican Institute", "52-2345678", "234567890"),
+    ("National Democratic Institute", "52-3456789", "345678901"),
+    ("Freedom House", "13-4567890", "456789012"),
+    ("CARE International", "13-5678901", "567890123"),
+    ("Save the Children", "06-6789012", "678901234"),
+    ("World Vision", "95-7890123", "789012345"),
+    ("Mercy Corps", "91-8901234", "890123456"),
+    ("International Rescue Committee", "13-9012345", "901234567"),
+    ("Catholic Relief Services", "52-0123456", "012345678"),
+)
+
+_SECTORS = (
+    "democracy_governance",
+    "health",
+    "education",
+    "economic_growth",
+    "humanitarian",
+    "environment",
+)
+
+_COUNTRIES = (
+    "UKR", "ISR", "EGY", "JOR", "AFG",
+    "ETH", "KEN", "NGA", "IND", "PHL",
+)
+
+_FISCAL_YEARS = (2022, 2023, 2024)
+
+_PARTNER_COUNTRIES = ("UKR", "AFG", "ETH", "KEN")
+
+# Organization names that mark a democracy-focused org in simulated FEC data
+_DEMOCRACY_RE = re.compile(r"democracy|republican|democratic|freedom", re.IGNORECASE)
+
+
+def _keyed_rng(key: str) -> random.Random:
+    """
+    Private generator seeded from a stable digest of key.
+
+    Same key, same draws in every process (unlike hash(), which is salted
+    per process), and the global random state is left untouched.
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return random.Random(int.from_bytes(digest, "little"))
+
+
+def _simulated_donation_recipients(political_donations: int) -> List[Dict[str, Any]]:
+    """Simulated split of a partner's political donations."""
+    if political_donations <= 0:
+        return []
+    return [
+        {"committee": "DNC", "amount": political_donations * 0.6},
+        {"committee": "Various PACs", "amount": political_donations * 0.4},
+    ]
+
+
+def _simulated_officers(count: int) -> List[Dict[str, str]]:
+    """Simulated officer roster of the given size."""
+    return [
+        {"name": f"Officer {j}", "title": "Executive Director" if j == 0 else "Board Member"}
+        for j in range(count)
+    ]
+
 
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ForeignAidAward:
     """Single foreign aid award record."""
     award_id: str
@@ -65,8 +156,12 @@ class ForeignAidAward:
     description: str
     implementing_partner: bool = False
     date: Optional[datetime] = None
+    # ISO form of date, filled on first to_dict (awards are not mutated)
+    _iso_date: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
+        if self._iso_date is None and self.date:
+            self._iso_date = self.date.isoformat()
         return {
             "award_id": self.award_id,
             "agency": self.agency,
@@ -78,11 +173,11 @@ class ForeignAidAward:
             "sector": self.sector,
             "description": self.description,
             "implementing_partner": self.implementing_partner,
-            "date": self.date.isoformat() if self.date else None,
+            "date": self._iso_date,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ImplementingPartner:
     """NGO implementing partner entity."""
     partner_id: str
@@ -101,24 +196,13 @@ class ImplementingPartner:
     officers: List[Dict[str, str]] = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        return {
-            "partner_id": self.partner_id,
-            "name": self.name,
-            "ein": self.ein,
-            "duns": self.duns,
-            "total_awards": self.total_awards,
-            "award_count": self.award_count,
-            "agencies": self.agencies,
-            "countries_served": self.countries_served,
-            "political_donations": self.political_donations,
-            "donation_recipients": self.donation_recipients,
-            "form_990_revenue": self.form_990_revenue,
-            "form_990_expenses": self.form_990_expenses,
-            "officers": self.officers,
-        }
+        return {name: getattr(self, name) for name in _PARTNER_FIELDS}
+
 
+_PARTNER_FIELDS = tuple(f.name for f in fields(ImplementingPartner))
 
-@dataclass
+
+@dataclass(slots=True)
 class RoundTripEvidence:
     """Evidence of potential round-trip funding."""
     partner_id: str
@@ -131,16 +215,145 @@ class RoundTripEvidence:
     details: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
-        return {
-            "partner_id": self.partner_id,
-            "partner_name": self.partner_name,
-            "award_amount": self.award_amount,
-            "donation_amount": self.donation_amount,
-            "temporal_gap_days": self.temporal_gap_days,
-            "score": self.score,
-            "flagged": self.flagged,
-            "details": self.details,
+        return {name: getattr(self, name) for name in _EVIDENCE_FIELDS}
+
+
+_EVIDENCE_FIELDS = tuple(f.name for f in fields(RoundTripEvidence))
+
+
+@dataclass(slots=True)
+class ImplementingPartnerFrame:
+    """
+    Column-oriented batch of implementing partners (one array per field).
+
+    Monetary and count columns are contiguous numeric arrays (int64
+    award and donation dollars, float64 only when an amount has cents;
+    int32 counts) so scans such as round-trip scoring run as single
+    vectorized passes; the remaining fields are object arrays. Convert
+    with to_dict_rows only at the serialization boundary. Requires numpy.
+    """
+    partner_id: "np.ndarray"
+    name: "np.ndarray"
+    ein: "np.ndarray"
+    duns: "np.ndarray"
+    total_awards: "np.ndarray"
+    award_count: "np.ndarray"
+    agencies: "np.ndarray"
+    countries_served: "np.ndarray"
+    political_donations: "np.ndarray"
+    donation_recipients: "np.ndarray"
+    form_990_revenue: "np.ndarray"
+    form_990_expenses: "np.ndarray"
+    officers: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.partner_id)
+
+    def iloc(self, i: int) -> ImplementingPartner:
+        """Materialize row i as an ImplementingPartner."""
+        row = {}
+        for name in _PARTNER_FIELDS:
+            column = getattr(self, name)
+            value = column[i]
+            row[name] = value if column.dtype == object else value.item()
+        return ImplementingPartner(**row)
+
+    def to_dict_rows(self) -> List[dict]:
+        """Rows as plain dicts (ImplementingPartner.to_dict layout)."""
+        columns = [getattr(self, name).tolist() for name in _PARTNER_FIELDS]
+        return [dict(zip(_PARTNER_FIELDS, row)) for row in zip(*columns)]
+
+    @classmethod
+    def from_partners(cls, partners: List[ImplementingPartner]) -> "ImplementingPartnerFrame":
+        """Build a frame from a list of ImplementingPartner rows."""
+        count = len(partners)
+        columns = {}
+        for name in _PARTNER_FIELDS:
+            values = [getattr(p, name) for p in partners]
+            dtype = _PARTNER_NUMERIC.get(name)
+            if dtype == "int64" and not all(float(v).is_integer() for v in values):
+                dtype = "float64"  # Fractional dollars
+            # Optional numeric fields holding None stay object columns
+            if dtype is not None and None not in values:
+                columns[name] = np.array(values, dtype=dtype)
+            else:
+                columns[name] = _object_column(values, count)
+        return cls(**columns)
+
+
+# Numeric ImplementingPartner fields and their frame column dtypes; int64
+# dollar columns widen to float64 when any amount is fractional
+_PARTNER_NUMERIC = {
+    "total_awards": "int64",
+    "award_count": "int32",
+    "political_donations": "int64",
+    "form_990_revenue": "float64",
+    "form_990_expenses": "float64",
+}
+
+
+def _object_column(values, count: int) -> "np.ndarray":
+    """1-D object array from an iterable, keeping list elements intact."""
+    return np.fromiter(values, dtype=object, count=count)
+
+
+def _award_rows(
+    agency: str,
+    sector: str,
+    columns: tuple,
+    start: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """Yield award dicts from _simulated_award_draws columns."""
+    if HAS_NUMPY:
+        columns = [np.asarray(column).tolist() for column in columns]
+
+    for i, (ngo, country, amount, fiscal_year, sector_idx, program_year) in enumerate(
+        zip(*columns), start
+    ):
+        yield {
+            "award_id": f"FA-{agency}-{i:06d}",
+            "agency": agency,
+            "recipient_name": _NGOS[ngo][0],
+            "recipient_ein": _NGOS[ngo][1],
+            "recipient_country": "USA",  # Implementing partner in US
+            "target_country": _COUNTRIES[country],
+            "amount": amount,
+            "fiscal_year": fiscal_year,
+            "sector": sector if sector else _SECTORS[sector_idx],
+            "description": f"Foreign assistance program FY{program_year}",
+            "implementing_partner": True,
+        }
+
+
+# ImplementingPartner fields carried into RoundTripEvidence, in order
+_EVIDENCE_SOURCE_FIELDS = (
+    "partner_id", "name", "total_awards", "political_donations",
+    "donation_recipients", "officers",
+)
+_evidence_source = attrgetter(*_EVIDENCE_SOURCE_FIELDS)
+
+
+def _round_trip_evidence(
+    source: tuple,
+    score: float,
+    threshold: float
+) -> RoundTripEvidence:
+    """Build RoundTripEvidence from a partner's _EVIDENCE_SOURCE_FIELDS values."""
+    partner_id, name, total_awards, political_donations, recipients, officers = source
+    return RoundTripEvidence(
+        partner_id=partner_id,
+        partner_name=name,
+        award_amount=total_awards,
+        donation_amount=political_donations,
+        temporal_gap_days=None,  # Would require date analysis
+        score=round(score, 4),
+        flagged=score >= threshold,
+        details={
+            "threshold": threshold,
+            "donation_recipients": recipients,
+            "officers": officers,
         }
+    )
 
 
 # ============================================================================
@@ -148,23 +361,84 @@ class RoundTripEvidence:
 # ============================================================================
 
 def _load_foreignaid_cohorts() -> dict:
-    """Load cohort configuration from data/foreignassistance_cohorts.json."""
+    """
+    Load cohort configuration from data/foreignassistance_cohorts.json.
+
+    The parsed config is cached per file mtime and shared between callers,
+    so treat the returned dict as read-only.
+    """
     module_dir = Path(__file__).parent.parent.parent
     config_path = module_dir / "data" / "foreignassistance_cohorts.json"
 
     if not config_path.exists():
         config_path = Path.cwd() / "data" / "foreignassistance_cohorts.json"
 
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
         return {"cohorts": {}, "metadata": {}}
 
+    return _parse_foreignaid_cohorts(str(config_path), mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _parse_foreignaid_cohorts(path: str, mtime_ns: int) -> dict:
+    """Parse a cohort config file; mtime_ns keys the cache to file changes."""
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        raw = Path(path).read_bytes()
+        return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
     except Exception:
         return {"cohorts": {}, "metadata": {}}
 
 
+# ============================================================================
+# PAYLOAD HASHING
+# ============================================================================
+
+def _freeze(obj: Any) -> Any:
+    """
+    Hashable, reversible form of a JSON-like payload.
+
+    Every node is tagged with its type so values that compare equal but
+    serialize differently (1, 1.0, True; a dict and its item list) never
+    share a cache entry.
+    """
+    if isinstance(obj, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in obj.items())))
+    if isinstance(obj, (list, tuple)):
+        return (list, tuple(_freeze(v) for v in obj))
+    return (type(obj), obj)
+
+
+def _thaw(frozen: Any) -> Any:
+    """Inverse of _freeze."""
+    kind, value = frozen
+    if kind is dict:
+        return {k: _thaw(v) for k, v in value}
+    if kind is list:
+        return [_thaw(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _hash_frozen(frozen: Any) -> str:
+    return dual_hash(canonical_json(_thaw(frozen), default=str))
+
+
+def _payload_hash(payload: Dict[str, Any]) -> str:
+    """
+    dual_hash of a payload's canonical JSON, memoized on payload content.
+
+    ETL receipts repeat across runs with the same filters, so repeats
+    are a cache lookup instead of a serialize + hash.
+    """
+    try:
+        return _hash_frozen(_freeze(payload))
+    except TypeError:
+        # Unhashable leaf values (e.g. sets): hash without caching
+        return dual_hash(canonical_json(payload, default=str))
+
+
 # ============================================================================
 # FOREIGN AID ETL CLASS
 # ============================================================================
@@ -192,46 +466,148 @@ class ForeignAidETL:
         >>> fec_data = etl.cross_reference_fec("NGO Name")
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, seed: int = 42):
         """
         Initialize ForeignAidETL.
 
         Args:
             api_key: Optional API key for ForeignAssistance.gov
                      (not required for most endpoints)
+            seed: Root seed for simulated award and partner draws
         """
         self.api_key = api_key
+        self.seed = seed
+        if HAS_NUMPY:
+            # Per-instance seed sequences; every call draws a fresh Generator
+            # from the same sequence, so repeated calls stay reproducible
+            self._award_seq = np.random.SeedSequence(seed)
+            self._partner_seq = np.random.SeedSequence(seed + 1)
         self.base_url = DATA_SOURCES["foreignassistance"]
         self._cohorts = _load_foreignaid_cohorts()
+        # Highest award_id returned by a watermarked fetch, per agency
+        self._last_watermark: Dict[str, str] = {}
 
     def fetch_awards(
         self,
         filters: Dict[str, Any],
-        _simulate: bool = True
+        _simulate: bool = True,
+        since_award_id: Optional[str] = None,
+        since_fiscal_year: Optional[int] = None,
+        incremental: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Query ForeignAssistance.gov API for award data.
 
+        With a watermark only awards newer than it are produced: award_id
+        greater than since_award_id (lexicographic on the zero-padded id)
+        and fiscal_year at or after since_fiscal_year. The highest award_id
+        returned is remembered per agency; incremental=True resumes from it.
+
         Args:
             filters: Query filters (agency, sector, country, etc.)
             _simulate: If True, return simulated data
+            since_award_id: Only return awards with a later award_id
+            since_fiscal_year: Only return awards from this fiscal year on
+            incremental: Default since_award_id to the stored watermark
 
         Returns:
             List of award records
 
         Emits:
-            foreignaid_ingest_receipt
+            foreignaid_ingest_receipt, or foreignaid_ingest_incremental
+            when a watermark is in effect
         """
+        agency = filters.get("agency", "USAID")
+        if incremental and since_award_id is None:
+            since_award_id = self._last_watermark.get(agency)
+
         if _simulate:
-            records = self._generate_simulated_awards(filters)
+            records = self._generate_simulated_awards(filters, since_award_id=since_award_id)
         else:
-            # Real API call would go here
+            # Real API call would go here, with the watermark as a predicate
             # records = self._api_fetch("/awards", filters)
-            records = self._generate_simulated_awards(filters)
-
-        self._emit_ingest_receipt(filters, len(records))
+            records = self._generate_simulated_awards(filters, since_award_id=since_award_id)
+
+        if since_fiscal_year is not None:
+            records = [r for r in records if r["fiscal_year"] >= since_fiscal_year]
+
+        if incremental or since_award_id is not None or since_fiscal_year is not None:
+            if records:
+                self._last_watermark[agency] = max(
+                    records[-1]["award_id"], self._last_watermark.get(agency, "")
+                )
+            self._emit_incremental_ingest_receipt(
+                filters, len(records), since_award_id, since_fiscal_year,
+                self._last_watermark.get(agency),
+            )
+        else:
+            self._emit_ingest_receipt(filters, len(records))
         return records
 
+    def fetch_awards_stream(
+        self,
+        filters: Dict[str, Any],
+        n: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream simulated award records without materializing the list.
+
+        Awards are drawn in chunks of AWARD_STREAM_CHUNK, each seeded from
+        its own child of the instance's award seed sequence, so memory
+        stays bounded for any n.
+        The stream is deterministic but does not reproduce fetch_awards.
+
+        Args:
+            filters: Query filters (agency, sector, country, etc.)
+            n: Number of awards to generate
+
+        Yields:
+            Award records
+
+        Emits:
+            foreignaid_ingest_receipt when the stream ends or is closed,
+            counting the records yielded so far
+        """
+        count = 0
+        try:
+            for record in self._iter_simulated_awards(filters, n):
+                count += 1
+                yield record
+        finally:
+            self._emit_ingest_receipt(filters, count)
+
+    def fetch_awards_arrow(
+        self,
+        filters: Dict[str, Any],
+        n: int = 100_000
+    ) -> "pa.RecordBatch":
+        """
+        Get simulated award data as an Arrow RecordBatch.
+
+        Built column by column from the same draws as fetch_awards, so
+        batch.to_pylist() matches fetch_awards for equal n.
+
+        Args:
+            filters: Query filters (agency, sector, country, etc.)
+            n: Number of awards to generate
+
+        Returns:
+            pyarrow RecordBatch with one row per award
+
+        Raises:
+            ImportError: If numpy or pyarrow is not installed
+
+        Emits:
+            foreignaid_ingest_receipt
+        """
+        if not (HAS_NUMPY and HAS_PYARROW):
+            raise ImportError("numpy and pyarrow are required for fetch_awards_arrow")
+
+        batch = self._generate_simulated_awards_batch(filters, n)
+
+        self._emit_ingest_receipt(filters, batch.num_rows)
+        return batch
+
     def fetch_implementing_partners(
         self,
         agency: str = "USAID",
@@ -258,6 +634,35 @@ class ForeignAidETL:
         self._emit_partner_receipt(agency, len(partners))
         return partners
 
+    def fetch_implementing_partners_frame(
+        self,
+        agency: str = "USAID",
+        _simulate: bool = True
+    ) -> ImplementingPartnerFrame:
+        """
+        Get NGO implementing partners for an agency as columns.
+
+        Args:
+            agency: Foreign aid agency (USAID, STATE, MCC)
+            _simulate: If True, return simulated data
+
+        Returns:
+            ImplementingPartnerFrame with one row per partner
+
+        Raises:
+            ImportError: If numpy is not installed
+
+        Emits:
+            implementing_partner_receipt
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for ImplementingPartnerFrame")
+
+        frame = self._generate_simulated_partners_frame(agency)
+
+        self._emit_partner_receipt(agency, len(frame))
+        return frame
+
     def fetch_country_allocations(
         self,
         fiscal_year: int,
@@ -370,24 +775,45 @@ class ForeignAidETL:
         else:
             score = 0.0
 
-        flagged = score >= threshold
-
-        evidence = RoundTripEvidence(
-            partner_id=partner.partner_id,
-            partner_name=partner.name,
-            award_amount=partner.total_awards,
-            donation_amount=partner.political_donations,
-            temporal_gap_days=None,  # Would require date analysis
-            score=round(score, 4),
-            flagged=flagged,
-            details={
-                "threshold": threshold,
-                "donation_recipients": partner.donation_recipients,
-                "officers": partner.officers,
-            }
-        )
+        return _round_trip_evidence(_evidence_source(partner), score, threshold)
+
+    def detect_round_trip_batch(
+        self,
+        partners: "List[ImplementingPartner] | ImplementingPartnerFrame",
+        threshold: float = 0.10
+    ) -> List[RoundTripEvidence]:
+        """
+        Detect round-trip funding across many partners at once.
 
-        return evidence
+        Scores every partner in one vectorized divide, with the zero-award
+        guard applied as a mask rather than a per-partner branch.
+
+        Args:
+            partners: ImplementingPartners to analyze, as a list or a frame
+            threshold: Donation/award ratio threshold
+
+        Returns:
+            RoundTripEvidence per partner, in input order
+        """
+        if isinstance(partners, ImplementingPartnerFrame):
+            awards = partners.total_awards.astype(np.float64)
+            donations = partners.political_donations.astype(np.float64)
+            # Evidence fields come straight from the columns, no row objects
+            sources = zip(*(getattr(partners, name).tolist() for name in _EVIDENCE_SOURCE_FIELDS))
+        elif not HAS_NUMPY:
+            return [self.detect_round_trip(p, threshold) for p in partners]
+        else:
+            count = len(partners)
+            awards = np.fromiter((p.total_awards for p in partners), dtype=np.float64, count=count)
+            donations = np.fromiter((p.political_donations for p in partners), dtype=np.float64, count=count)
+            sources = map(_evidence_source, partners)
+
+        scores = np.divide(donations, awards, out=np.zeros_like(donations), where=awards > 0)
+
+        return [
+            _round_trip_evidence(source, score, threshold)
+            for source, score in zip(sources, scores.tolist())
+        ]
 
     # ========================================================================
     # SIMULATED DATA GENERATORS
@@ -396,60 +822,123 @@ class ForeignAidETL:
     def _generate_simulated_awards(
         self,
         filters: Dict[str, Any],
-        n: int = 100
+        n: int = 100,
+        since_award_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Generate simulated foreign aid awards."""
-        import random
-        random.seed(42)
+        """
+        Generate simulated foreign aid awards.
 
+        Award ids increase with row index, so rows at or before
+        since_award_id are sliced off the drawn columns instead of
+        being built and filtered.
+        """
         agency = filters.get("agency", "USAID")
         sector = filters.get("sector", "democracy_governance")
 
-        sectors = [
-            "democracy_governance",
-            "health",
-            "education",
-            "economic_growth",
-            "humanitarian",
-            "environment",
-        ]
+        columns = self._simulated_award_draws(n)
+        start = 0
+        if since_award_id is not None:
+            start = bisect.bisect_right(
+                range(n), since_award_id, key=lambda i: f"FA-{agency}-{i:06d}"
+            )
+            columns = tuple(column[start:] for column in columns)
 
-        countries = [
-            "UKR", "ISR", "EGY", "JOR", "AFG",
-            "ETH", "KEN", "NGA", "IND", "PHL",
-        ]
+        return list(_award_rows(agency, sector, columns, start))
 
-        ngos = [
-            ("Democracy International", "52-1234567"),
-            ("International Republican Institute", "52-2345678"),
-            ("National Democratic Institute", "52-3456789"),
-            ("Freedom House", "13-4567890"),
-            ("CARE International", "13-5678901"),
-            ("Save the Children", "06-6789012"),
-            ("World Vision", "95-7890123"),
-            ("Mercy Corps", "91-8901234"),
-            ("International Rescue Committee", "13-9012345"),
-            ("Catholic Relief Services", "52-0123456"),
-        ]
+    def _iter_simulated_awards(
+        self,
+        filters: Dict[str, Any],
+        n: int,
+        chunk_size: int = AWARD_STREAM_CHUNK
+    ) -> Iterator[Dict[str, Any]]:
+        """Generate simulated awards chunk by chunk, one seed per chunk."""
+        agency = filters.get("agency", "USAID")
+        sector = filters.get("sector", "democracy_governance")
 
-        awards = []
-        for i in range(n):
-            ngo_name, ngo_ein = random.choice(ngos)
-            awards.append({
-                "award_id": f"FA-{agency}-{i:06d}",
-                "agency": agency,
-                "recipient_name": ngo_name,
-                "recipient_ein": ngo_ein,
-                "recipient_country": "USA",  # Implementing partner in US
-                "target_country": random.choice(countries),
-                "amount": random.randint(100_000, 50_000_000),
-                "fiscal_year": random.choice([2022, 2023, 2024]),
-                "sector": sector if sector else random.choice(sectors),
-                "description": f"Foreign assistance program FY{random.randint(2022, 2024)}",
-                "implementing_partner": True,
-            })
-
-        return awards
+        if not HAS_NUMPY:
+            # The stdlib draws are already row by row; one stream suffices
+            yield from _award_rows(agency, sector, self._simulated_award_draws(n))
+            return
+
+        chunk_count = -(-n // chunk_size)
+        # Children are derived by spawn_key rather than spawn(), which would
+        # advance the parent and change the stream on the next call
+        root = self._award_seq
+        seeds = (
+            np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (k,))
+            for k in range(chunk_count)
+        )
+        for chunk, seed in enumerate(seeds):
+            start = chunk * chunk_size
+            size = min(chunk_size, n - start)
+            columns = self._simulated_award_draws(size, np.random.default_rng(seed))
+            yield from _award_rows(agency, sector, columns, start)
+
+    def _generate_simulated_awards_batch(
+        self,
+        filters: Dict[str, Any],
+        n: int
+    ) -> "pa.RecordBatch":
+        """Generate simulated awards as Arrow columns from the same draws."""
+        agency = filters.get("agency", "USAID")
+        sector = filters.get("sector", "democracy_governance")
+        ngo, country, amount, fiscal_year, sector_idx, program_year = (
+            self._simulated_award_draws(n)
+        )
+        names, eins, _ = (np.array(column) for column in zip(*_NGOS))
+
+        return pa.RecordBatch.from_pydict({
+            "award_id": pa.array([f"FA-{agency}-{i:06d}" for i in range(n)], pa.string()),
+            "agency": pa.array(np.full(n, agency)),
+            "recipient_name": pa.array(names[ngo]),
+            "recipient_ein": pa.array(eins[ngo]),
+            "recipient_country": pa.array(np.full(n, "USA")),
+            "target_country": pa.array(np.array(_COUNTRIES)[country]),
+            "amount": pa.array(amount),
+            "fiscal_year": pa.array(fiscal_year),
+            "sector": pa.array(
+                np.full(n, sector) if sector else np.array(_SECTORS)[sector_idx]
+            ),
+            "description": pa.array(
+                np.char.add("Foreign assistance program FY", program_year.astype(str))
+            ),
+            "implementing_partner": pa.array(np.ones(n, dtype=bool)),
+        })
+
+    def _simulated_award_draws(self, n: int, rng=None) -> tuple:
+        """
+        Random award columns: NGO index, country index, amount, fiscal
+        year, sector index and program year.
+
+        numpy arrays when numpy is installed, lists otherwise. rng
+        overrides the generator seeded from the instance's award sequence.
+        """
+        if HAS_NUMPY:
+            # One draw per column instead of six RNG calls per award
+            if rng is None:
+                rng = np.random.default_rng(self._award_seq)
+            return (
+                rng.integers(0, len(_NGOS), n),
+                rng.integers(0, len(_COUNTRIES), n),
+                rng.integers(100_000, 50_000_001, n, dtype=np.int64),
+                rng.choice(_FISCAL_YEARS, n),
+                rng.integers(0, len(_SECTORS), n),
+                rng.choice(_FISCAL_YEARS, n),
+            )
+
+        rng = random.Random(self.seed)
+        rows = [
+            (
+                rng.randrange(len(_NGOS)),
+                rng.randrange(len(_COUNTRIES)),
+                rng.randint(100_000, 50_000_000),
+                rng.choice(_FISCAL_YEARS),
+                rng.randrange(len(_SECTORS)),
+                rng.randint(2022, 2024),
+            )
+            for _ in range(n)
+        ]
+        return tuple(list(column) for column in zip(*rows)) if rows else ([],) * 6
 
     def _generate_simulated_partners(
         self,
@@ -457,67 +946,110 @@ class ForeignAidETL:
         n: int = 20
     ) -> List[ImplementingPartner]:
         """Generate simulated implementing partners."""
-        import random
-        random.seed(43)
-
-        ngos = [
-            ("Democracy International", "52-1234567", "123456789"),
-            ("International Republican Institute", "52-2345678", "234567890"),
-            ("National Democratic Institute", "52-3456789", "345678901"),
-            ("Freedom House", "13-4567890", "456789012"),
-            ("CARE International", "13-5678901", "567890123"),
-            ("Save the Children", "06-6789012", "678901234"),
-            ("World Vision", "95-7890123", "789012345"),
-            ("Mercy Corps", "91-8901234", "890123456"),
-            ("International Rescue Committee", "13-9012345", "901234567"),
-            ("Catholic Relief Services", "52-0123456", "012345678"),
-        ]
+        ngos = _NGOS[:n]
+        columns = self._simulated_partner_draws(len(ngos))
+        if HAS_NUMPY:
+            columns = [column.tolist() for column in columns]
 
         partners = []
-        for i, (name, ein, duns) in enumerate(ngos[:n]):
-            total_awards = random.randint(10_000_000, 500_000_000)
-            # Simulate varying levels of political donations
-            # Most NGOs have minimal donations, some have more
-            if i < 3:  # First 3 have higher political activity (democracy orgs)
-                political_donations = random.randint(100_000, 2_000_000)
-            else:
-                political_donations = random.randint(0, 50_000)
-
+        for i, ((name, ein, duns), (total_awards, political_donations, award_count,
+                                    country_count, officer_count)) in enumerate(zip(ngos, zip(*columns))):
             partners.append(ImplementingPartner(
                 partner_id=f"IP-{i:04d}",
                 name=name,
                 ein=ein,
                 duns=duns,
                 total_awards=total_awards,
-                award_count=random.randint(10, 200),
+                award_count=award_count,
                 agencies=[agency],
-                countries_served=["UKR", "AFG", "ETH", "KEN"][:random.randint(1, 4)],
+                countries_served=list(_PARTNER_COUNTRIES[:country_count]),
                 political_donations=political_donations,
-                donation_recipients=[
-                    {"committee": "DNC", "amount": political_donations * 0.6},
-                    {"committee": "Various PACs", "amount": political_donations * 0.4},
-                ] if political_donations > 0 else [],
+                donation_recipients=_simulated_donation_recipients(political_donations),
                 form_990_revenue=total_awards * 1.5,  # Revenue > awards
                 form_990_expenses=total_awards * 1.4,
-                officers=[
-                    {"name": f"Officer {j}", "title": "Executive Director" if j == 0 else "Board Member"}
-                    for j in range(random.randint(3, 8))
-                ],
+                officers=_simulated_officers(officer_count),
             ))
 
         return partners
 
+    def _generate_simulated_partners_frame(
+        self,
+        agency: str,
+        n: int = 20
+    ) -> "ImplementingPartnerFrame":
+        """Generate simulated implementing partners directly as columns."""
+        ngos = _NGOS[:n]
+        count = len(ngos)
+        total_awards, political_donations, award_count, country_count, officer_count = (
+            self._simulated_partner_draws(count)
+        )
+
+        return ImplementingPartnerFrame(
+            partner_id=_object_column((f"IP-{i:04d}" for i in range(count)), count),
+            name=_object_column((ngo[0] for ngo in ngos), count),
+            ein=_object_column((ngo[1] for ngo in ngos), count),
+            duns=_object_column((ngo[2] for ngo in ngos), count),
+            total_awards=total_awards,
+            award_count=award_count,
+            agencies=_object_column(([agency] for _ in range(count)), count),
+            countries_served=_object_column(
+                (list(_PARTNER_COUNTRIES[:k]) for k in country_count.tolist()), count
+            ),
+            political_donations=political_donations,
+            donation_recipients=_object_column(
+                map(_simulated_donation_recipients, political_donations.tolist()), count
+            ),
+            form_990_revenue=total_awards * 1.5,  # Revenue > awards
+            form_990_expenses=total_awards * 1.4,
+            officers=_object_column(map(_simulated_officers, officer_count.tolist()), count),
+        )
+
+    def _simulated_partner_draws(self, count: int) -> tuple:
+        """
+        Random partner columns: total awards, political donations, award
+        count, countries served count and officer count.
+
+        numpy arrays when numpy is installed, lists otherwise.
+        """
+        # Simulate varying levels of political donations: the first 3
+        # (democracy orgs) have higher political activity, most have minimal
+        if HAS_NUMPY:
+            rng = np.random.default_rng(self._partner_seq)
+            # Dollar amounts need int64 (agency totals exceed 2**31); counts fit int32
+            return (
+                rng.integers(10_000_000, 500_000_001, count, dtype=np.int64),
+                np.where(
+                    np.arange(count) < 3,
+                    rng.integers(100_000, 2_000_001, count, dtype=np.int64),
+                    rng.integers(0, 50_001, count, dtype=np.int64),
+                ),
+                rng.integers(10, 201, count, dtype=np.int32),
+                rng.integers(1, 5, count, dtype=np.int32),
+                rng.integers(3, 9, count, dtype=np.int32),
+            )
+
+        rng = random.Random(self.seed + 1)
+        rows = [
+            (
+                rng.randint(10_000_000, 500_000_000),
+                rng.randint(100_000, 2_000_000) if i < 3 else rng.randint(0, 50_000),
+                rng.randint(10, 200),
+                rng.randint(1, 4),
+                rng.randint(3, 8),
+            )
+            for i in range(count)
+        ]
+        return tuple(list(column) for column in zip(*rows)) if rows else ([],) * 5
+
     def _generate_simulated_fec(self, org_name: str) -> Dict[str, Any]:
         """Generate simulated FEC data."""
-        import random
-        random.seed(hash(org_name) % 10000)
+        rng = _keyed_rng(org_name)
 
         # Democracy-focused orgs have higher political activity
-        is_democracy_org = any(term in org_name.lower() for term in
-                              ["democracy", "republican", "democratic", "freedom"])
+        is_democracy_org = _DEMOCRACY_RE.search(org_name) is not None
 
         if is_democracy_org:
-            total_donations = random.randint(500_000, 2_000_000)
+            total_donations = rng.randint(500_000, 2_000_000)
             donations = [
                 {"committee": "DNC", "amount": total_donations * 0.4},
                 {"committee": "DCCC", "amount": total_donations * 0.3},
@@ -525,7 +1057,7 @@ class ForeignAidETL:
                 {"committee": "Various PACs", "amount": total_donations * 0.1},
             ]
         else:
-            total_donations = random.randint(0, 100_000)
+            total_donations = rng.randint(0, 100_000)
             donations = [
                 {"committee": "Various PACs", "amount": total_donations},
             ] if total_donations > 0 else []
@@ -534,17 +1066,16 @@ class ForeignAidETL:
             "organization": org_name,
             "total_donations": total_donations,
             "donations": donations,
-            "officers_donations": random.randint(0, total_donations // 2),
+            "officers_donations": rng.randint(0, total_donations // 2),
             "years_covered": [2020, 2021, 2022, 2023, 2024],
             "data_source": "FEC API (simulated)",
         }
 
     def _generate_simulated_990(self, ein: str) -> Dict[str, Any]:
         """Generate simulated Form 990 data."""
-        import random
-        random.seed(hash(ein) % 10000)
+        rng = _keyed_rng(ein)
 
-        revenue = random.randint(50_000_000, 500_000_000)
+        revenue = rng.randint(50_000_000, 500_000_000)
         return {
             "ein": ein,
             "fiscal_year": 2023,
@@ -554,7 +1085,7 @@ class ForeignAidETL:
             "admin_expenses": int(revenue * 0.10),
             "fundraising_expenses": int(revenue * 0.05),
             "net_assets": int(revenue * 0.3),
-            "employees": random.randint(100, 5000),
+            "employees": rng.randint(100, 5000),
             "data_source": "ProPublica Nonprofit Explorer (simulated)",
         }
 
@@ -577,7 +1108,32 @@ class ForeignAidETL:
         return emit_receipt("foreignaid_ingest", {
             "tenant_id": TENANT_ID,
             **payload,
-            "payload_hash": dual_hash(json.dumps(payload, sort_keys=True, default=str)),
+            "payload_hash": _payload_hash(payload),
+            "simulation_flag": DISCLAIMER,
+        }, to_stdout=False)
+
+    def _emit_incremental_ingest_receipt(
+        self,
+        filters: Dict[str, Any],
+        record_count: int,
+        since_award_id: Optional[str],
+        since_fiscal_year: Optional[int],
+        high_watermark: Optional[str]
+    ) -> dict:
+        """Emit foreignaid_ingest_incremental receipt."""
+        payload = {
+            "filters": filters,
+            "record_count": record_count,
+            "since_award_id": since_award_id,
+            "since_fiscal_year": since_fiscal_year,
+            "high_watermark": high_watermark,
+            "data_source": "foreignassistance.gov",
+        }
+
+        return emit_receipt("foreignaid_ingest_incremental", {
+            "tenant_id": TENANT_ID,
+            **payload,
+            "payload_hash": _payload_hash(payload),
             "simulation_flag": DISCLAIMER,
         }, to_stdout=False)
 
@@ -595,7 +1151,7 @@ class ForeignAidETL:
         return emit_receipt("implementing_partner", {
             "tenant_id": TENANT_ID,
             **payload,
-            "payload_hash": dual_hash(json.dumps(payload, sort_keys=True)),
+            "payload_hash": _payload_hash(payload),
             "simulation_flag": DISCLAIMER,
         }, to_stdout=False)
 
@@ -618,7 +1174,7 @@ class ForeignAidETL:
         return emit_receipt("cross_reference", {
             "tenant_id": TENANT_ID,
             **payload,
-            "payload_hash": dual_hash(json.dumps(payload, sort_keys=True)),
+            "payload_hash": _payload_hash(payload),
             "simulation_flag": DISCLAIMER,
         }, to_stdout=False)
 
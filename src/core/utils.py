@@ -16,6 +16,10 @@ try:
 except ImportError:
     HAS_BLAKE3 = False
 
+# Inputs at least this large are hashed with blake3's multithreaded mode;
+# below it thread dispatch costs more than it saves
+BLAKE3_THREADED_MIN_BYTES = 1 << 20
+
 
 def dual_hash(data: bytes | str) -> str:
     """
@@ -31,10 +35,32 @@ def dual_hash(data: bytes | str) -> str:
     if isinstance(data, str):
         data = data.encode('utf-8')
     sha = hashlib.sha256(data).hexdigest()
-    b3 = blake3.blake3(data).hexdigest() if HAS_BLAKE3 else sha
+    if not HAS_BLAKE3:
+        return f"{sha}:{sha}"
+    if len(data) >= BLAKE3_THREADED_MIN_BYTES:
+        b3 = blake3.blake3(data, max_threads=blake3.blake3.AUTO).hexdigest()
+    else:
+        b3 = blake3.blake3(data).hexdigest()
     return f"{sha}:{b3}"
 
 
+def canonical_json(obj: Any, default=None) -> bytes:
+    """
+    Sorted-key JSON bytes of obj; the one encoding used for hashing.
+
+    Always the stdlib encoder: orjson writes some floats (1e16), NaN and
+    big ints differently, so hashes would depend on what is installed.
+
+    Args:
+        obj: JSON-serializable value
+        default: Called for values json cannot encode (e.g. str)
+
+    Returns:
+        UTF-8 bytes of json.dumps(obj, sort_keys=True)
+    """
+    return json.dumps(obj, sort_keys=True, default=default).encode('utf-8')
+
+
 def merkle(items: list) -> str:
     """
     Compute Merkle root of items using dual_hash.
@@ -48,7 +74,7 @@ def merkle(items: list) -> str:
     if not items:
         return dual_hash(b"empty")
 
-    hashes = [dual_hash(json.dumps(i, sort_keys=True) if isinstance(i, dict) else str(i))
+    hashes = [dual_hash(canonical_json(i) if isinstance(i, dict) else str(i))
               for i in items]
 
     while len(hashes) > 1:
@@ -11,17 +11,18 @@ Plug-in Pattern:
 5. Core physics engine uses domain config without knowing domain details
 """
 
+import copy
 import importlib
 import os
+import threading
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
-import yaml
-
 from .core import DISCLAIMER
 
 
-@dataclass
+@dataclass(slots=True)
 class VolatilityIndex:
     """Base volatility index for domain adaptation."""
     name: str = "base"
@@ -37,7 +38,7 @@ class VolatilityIndex:
         self.base_value = self.alpha * observation + (1 - self.alpha) * self.base_value
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainConfig:
     """Container for domain configuration."""
     name: str
@@ -66,8 +67,21 @@ class DomainConfig:
         }
 
 
-# Global domain registry
+# Global domain registry. Copy-on-write: readers use the current binding
+# without locking; writers build a new dict under _REGISTRY_LOCK and rebind.
 _DOMAIN_REGISTRY: Dict[str, DomainConfig] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _registry_put(name: str, config: DomainConfig, replace: bool = True) -> DomainConfig:
+    """Publish config under name; with replace=False keep an existing entry."""
+    global _DOMAIN_REGISTRY
+    with _REGISTRY_LOCK:
+        existing = _DOMAIN_REGISTRY.get(name)
+        if existing is not None and not replace:
+            return existing
+        _DOMAIN_REGISTRY = {**_DOMAIN_REGISTRY, name: config}
+        return config
 
 
 def register_domain(name: str, config: DomainConfig) -> None:
@@ -78,7 +92,7 @@ def register_domain(name: str, config: DomainConfig) -> None:
         name: Domain name
         config: DomainConfig object
     """
-    _DOMAIN_REGISTRY[name] = config
+    _registry_put(name, config)
 
 
 def load_domain(name: str) -> DomainConfig:
@@ -94,9 +108,10 @@ def load_domain(name: str) -> DomainConfig:
     Raises:
         ValueError: If domain not found
     """
-    # Check registry first
-    if name in _DOMAIN_REGISTRY:
-        return _DOMAIN_REGISTRY[name]
+    # Check registry first (lock-free read of the current snapshot)
+    config = _DOMAIN_REGISTRY.get(name)
+    if config is not None:
+        return config
 
     # Try to load from domains directory
     try:
@@ -104,8 +119,10 @@ def load_domain(name: str) -> DomainConfig:
         config_path = os.path.join(base_dir, "domains", name, "config.yaml")
 
         if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
+            # Copy: DomainConfig keeps references into the parsed data
+            config_data = copy.deepcopy(
+                _parse_yaml_cached(config_path, os.stat(config_path).st_mtime_ns)
+            )
 
             config = _parse_config(name, config_data)
 
@@ -117,8 +134,8 @@ def load_domain(name: str) -> DomainConfig:
             except ImportError:
                 config.volatility = VolatilityIndex(name=f"{name}_default")
 
-            _DOMAIN_REGISTRY[name] = config
-            return config
+            # A concurrent loader may have won; everyone returns its config
+            return _registry_put(name, config, replace=False)
 
     except Exception:
         pass
@@ -130,8 +147,26 @@ def load_domain(name: str) -> DomainConfig:
         tenant_id=f"gov-os-{name}",
         volatility=VolatilityIndex(name=f"{name}_default"),
     )
-    _DOMAIN_REGISTRY[name] = default_config
-    return default_config
+    return _registry_put(name, default_config, replace=False)
+
+
+@lru_cache(maxsize=128)
+def _parse_yaml_cached(path: str, mtime_ns: int) -> Any:
+    """
+    Parse a YAML file with the libyaml loader when available.
+
+    Keyed on mtime_ns so edited files are re-parsed. The result is
+    shared between callers; treat it as read-only. yaml is imported
+    here so registry hits and default configs never pay for it.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=loader)
 
 
 def _parse_config(name: str, data: Dict[str, Any]) -> DomainConfig:
@@ -162,17 +197,23 @@ def list_domains() -> List[str]:
     base_dir = os.path.dirname(os.path.abspath(__file__))
     domains_dir = os.path.join(base_dir, "domains")
 
-    domains = list(_DOMAIN_REGISTRY.keys())
+    domains = set(_DOMAIN_REGISTRY)
 
-    if os.path.exists(domains_dir):
-        for name in os.listdir(domains_dir):
-            module_path = os.path.join(domains_dir, name)
-            if os.path.isdir(module_path) and name not in domains and not name.startswith("__"):
-                config_path = os.path.join(module_path, "config.yaml")
-                if os.path.exists(config_path):
-                    domains.append(name)
+    # One directory read; is_dir() is answered from the dirent type on Linux
+    # (only symlinked entries need a stat)
+    try:
+        with os.scandir(domains_dir) as entries:
+            for entry in entries:
+                if entry.name in domains or entry.name.startswith("__"):
+                    continue
+                if not entry.is_dir():
+                    continue
+                if os.path.exists(os.path.join(entry.path, "config.yaml")):
+                    domains.add(entry.name)
+    except FileNotFoundError:
+        pass
 
-    return sorted(set(domains))
+    return sorted(domains)
 
 
 def get_volatility(domain: str) -> VolatilityIndex:
@@ -216,11 +257,14 @@ def validate_receipt(receipt: Dict[str, Any], domain: str) -> bool:
 
 def unregister_domain(name: str) -> None:
     """Remove domain from registry."""
-    if name in _DOMAIN_REGISTRY:
-        del _DOMAIN_REGISTRY[name]
+    global _DOMAIN_REGISTRY
+    with _REGISTRY_LOCK:
+        if name in _DOMAIN_REGISTRY:
+            _DOMAIN_REGISTRY = {k: v for k, v in _DOMAIN_REGISTRY.items() if k != name}
 
 
 def reset_registry() -> None:
     """Reset the domain registry. Use for testing."""
     global _DOMAIN_REGISTRY
-    _DOMAIN_REGISTRY = {}
+    with _REGISTRY_LOCK:
+        _DOMAIN_REGISTRY = {}
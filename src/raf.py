@@ -85,8 +85,41 @@ def build_transaction_graph(transactions: list) -> 'nx.DiGraph':
     if not HAS_NETWORKX:
         raise ImportError("NetworkX required for RAF analysis. Install: pip install networkx")
 
+    nodes, edges = _aggregate_edges(transactions)
+
     G = nx.DiGraph()
+    G.add_nodes_from(
+        (node, {"entity_type": entity_type}) for node, entity_type in nodes.items()
+    )
+    G.add_edges_from((u, v, attrs) for (u, v), attrs in edges.items())
+    return G
 
+
+def _aggregate_edges(
+    transactions: list,
+    domain: Optional[str] = None,
+    keyed_first: Optional[dict] = None,
+) -> Tuple[dict, dict]:
+    """
+    Aggregate transactions into node and edge attributes in one pass.
+
+    Each edge sums weight and transaction_count and keeps the latest
+    last_seen_date; the first transaction supplies initial_weight and
+    domain. Shared by build_transaction_graph and the contagion
+    scenario's build_domain_graph.
+
+    Args:
+        transactions: List of transaction dicts with source/target entities
+        domain: Domain for every edge (default: each first tx's "domain")
+        keyed_first: If given, filled with (source, target) -> raw date of
+            the first transaction keyed on source_duns/target_duns
+
+    Returns:
+        (node -> entity_type, (source, target) -> edge attributes), both
+        in first-seen order
+    """
+    nodes = {}
+    edges = {}
     for tx in transactions:
         # Extract source and target entities
         source = tx.get("source_duns") or tx.get("vendor") or tx.get("from")
@@ -95,11 +128,10 @@ def build_transaction_graph(transactions: list) -> 'nx.DiGraph':
         if not source or not target:
             continue
 
-        # Add nodes with attributes
-        if not G.has_node(source):
-            G.add_node(source, entity_type=tx.get("source_type", "unknown"))
-        if not G.has_node(target):
-            G.add_node(target, entity_type=tx.get("target_type", "unknown"))
+        if source not in nodes:
+            nodes[source] = tx.get("source_type", "unknown")
+        if target not in nodes:
+            nodes[target] = tx.get("target_type", "unknown")
 
         # Get transaction date for temporal tracking
         tx_date = tx.get("date")
@@ -111,27 +143,33 @@ def build_transaction_graph(transactions: list) -> 'nx.DiGraph':
         elif not isinstance(tx_date, datetime):
             tx_date = datetime.utcnow()
 
-        # Add edge with transaction metadata
-        if G.has_edge(source, target):
-            # Update existing edge
-            G[source][target]["weight"] += tx.get("amount_usd", 0)
-            G[source][target]["transaction_count"] += 1
-            # Update last_seen_date if this transaction is more recent
-            existing_date = G[source][target].get("last_seen_date")
-            if existing_date is None or tx_date > existing_date:
-                G[source][target]["last_seen_date"] = tx_date
+        amount = tx.get("amount_usd", 0)
+        edge = edges.get((source, target))
+        if edge is None:
+            edges[(source, target)] = {
+                "weight": amount,
+                "initial_weight": amount,
+                "transaction_count": 1,
+                "edge_type": "financial",
+                "last_seen_date": tx_date,
+                "domain": domain if domain is not None else tx.get("domain", "unknown"),
+            }
         else:
-            G.add_edge(
-                source, target,
-                weight=tx.get("amount_usd", 0),
-                initial_weight=tx.get("amount_usd", 0),
-                transaction_count=1,
-                edge_type="financial",
-                last_seen_date=tx_date,
-                domain=tx.get("domain", "unknown"),
-            )
+            edge["weight"] += amount
+            edge["transaction_count"] += 1
+            # Update last_seen_date if this transaction is more recent
+            if tx_date > edge["last_seen_date"]:
+                edge["last_seen_date"] = tx_date
 
-    return G
+        if (
+            keyed_first is not None
+            and (source, target) not in keyed_first
+            and tx.get("source_duns") == source
+            and tx.get("target_duns") == target
+        ):
+            keyed_first[(source, target)] = tx.get("date")
+
+    return nodes, edges
 
 
 def add_catalytic_links(
@@ -263,9 +301,15 @@ def detect_cycles(
 
     cycles = []
 
-    # Use NetworkX simple_cycles with length filtering
+    # Use NetworkX simple_cycles with length filtering. length_bound
+    # (networkx >= 3.1) prunes the search at max_length instead of
+    # enumerating every cycle and discarding the long ones.
     try:
-        for cycle in nx.simple_cycles(graph):
+        try:
+            cycle_iter = nx.simple_cycles(graph, length_bound=max_length)
+        except TypeError:
+            cycle_iter = nx.simple_cycles(graph)
+        for cycle in cycle_iter:
             cycle_length = len(cycle)
             if min_length <= cycle_length <= max_length:
                 # Add closing node to make cycle explicit
@@ -554,19 +598,18 @@ def build_super_graph(
         for node, data in domain_graph.nodes(data=True):
             if G.has_node(node):
                 # Node exists - track all domains
-                existing_domains = G.nodes[node].get("domains", [])
-                if isinstance(existing_domains, str):
-                    existing_domains = [existing_domains]
+                # "domains" is always a list: nodes are created with one
+                existing_domains = G.nodes[node]["domains"]
                 if domain_name not in existing_domains:
                     existing_domains.append(domain_name)
-                G.nodes[node]["domains"] = existing_domains
             else:
                 G.add_node(node, **data, domain=domain_name, domains=[domain_name])
 
         # Copy edges with domain metadata
         for u, v, data in domain_graph.edges(data=True):
             if G.has_edge(u, v):
-                # Edge exists - merge domains
+                # Edge exists - merge domains; input edge attributes are
+                # copied as-is, so "domains" may arrive as a bare string
                 existing = G[u][v].get("domains", [G[u][v].get("domain", "unknown")])
                 if isinstance(existing, str):
                     existing = [existing]
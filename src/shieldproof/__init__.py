@@ -23,209 +23,137 @@ Components (3, not 20):
 
 __version__ = "2.1.0"
 
-# === CORE MODULE (v2.1 modular structure) ===
-from .core import (
-    # Constants
-    TENANT_ID,
-    VERSION,
-    DISCLAIMER,
-    RECEIPT_TYPES,
-    MILESTONE_STATES,
-    VARIANCE_THRESHOLD,
-    LEDGER_PATH,
-    # Utils
-    dual_hash,
-    merkle,
-    StopRule,
-    StopRuleException,
-    validate_hash,
-    timestamp_iso,
-    generate_id,
-    # Receipt
-    emit_receipt,
-    validate_receipt,
-    load_receipts,
-    append_receipt,
-    # Ledger
-    load_ledger,
-    query_receipts,
-    clear_ledger,
-    get_ledger,
-    add_to_ledger,
-    anchor_batch,
-    get_by_type,
-    get_by_id,
-    # Anchor
-    anchor_receipt,
-    anchor_chain,
-    verify_anchor,
-    # Gate
-    check_t2h,
-    check_t24h,
-    check_t48h,
-    gate_status,
-)
+import importlib
 
-# === CONTRACT MODULE ===
-from .contract import (
-    register_contract,
-    get_contract,
-    list_contracts,
-    get_contract_milestones,
-    update_contract,
-    emit_contract_receipt,
-)
+# Public names re-exported from each submodule. Listed once here; __all__
+# and the lazy lookup below are generated from this table.
+_EXPORTS = {
+    "core": (
+        # Constants
+        "TENANT_ID",
+        "VERSION",
+        "DISCLAIMER",
+        "RECEIPT_TYPES",
+        "MILESTONE_STATES",
+        "VARIANCE_THRESHOLD",
+        "LEDGER_PATH",
+        # Utils
+        "dual_hash",
+        "dual_hash_bytes",
+        "merkle",
+        "merkle_parallel",
+        "IncrementalMerkle",
+        "StopRule",
+        "StopRuleException",
+        "validate_hash",
+        "timestamp_iso",
+        "generate_id",
+        # Receipt
+        "emit_receipt",
+        "emit_receipts_batch",
+        "set_stdout_default",
+        "validate_receipt",
+        "load_receipts",
+        "append_receipt",
+        # Ledger
+        "load_ledger",
+        "query_receipts",
+        "clear_ledger",
+        "invalidate_cache",
+        "distinct_values",
+        "get_latest_by_field",
+        "get_ledger",
+        "add_to_ledger",
+        "anchor_batch",
+        "get_by_type",
+        "get_by_id",
+        # Anchor
+        "anchor_receipt",
+        "anchor_chain",
+        "verify_anchor",
+        # Gate
+        "check_t2h",
+        "check_t24h",
+        "check_t48h",
+        "gate_status",
+        "gate_clear_cache",
+    ),
+    "contract": (
+        "register_contract",
+        "get_contract",
+        "list_contracts",
+        "get_contract_milestones",
+        "update_contract",
+        "emit_contract_receipt",
+    ),
+    "milestone": (
+        "submit_milestone",
+        "submit_deliverable",
+        "verify_milestone",
+        "get_milestone",
+        "list_milestones",
+        "list_pending",
+        "list_verified",
+        "list_disputed",
+        "emit_milestone_receipt",
+    ),
+    "payment": (
+        "request_payment",
+        "release_payment",
+        "get_payment",
+        "get_payments",
+        "list_payments",
+        "total_paid",
+        "total_outstanding",
+        "emit_payment_receipt",
+    ),
+    "reconcile": (
+        "check_variance",
+        "variance_report",
+        "flag_contracts",
+        "reconcile_contract",
+        "reconcile_all",
+        "flag_anomaly",
+        "get_waste_summary",
+        "emit_variance_receipt",
+    ),
+    "dashboard": (
+        "export_dashboard",
+        "dashboard_summary",
+        "contracts_by_status",
+        "generate_summary",
+        "contract_status",
+        "export_csv",
+        "export_json",
+        "format_currency",
+        "print_dashboard",
+        "serve",
+        "check",
+        "emit_dashboard_receipt",
+    ),
+    "scenarios": (
+        "run_baseline_scenario",
+        "run_stress_scenario",
+    ),
+}
 
-# === MILESTONE MODULE ===
-from .milestone import (
-    submit_milestone,
-    submit_deliverable,
-    verify_milestone,
-    get_milestone,
-    list_milestones,
-    list_pending,
-    list_verified,
-    list_disputed,
-    emit_milestone_receipt,
-)
+# Name -> submodule. Submodules are imported on first attribute access
+# (PEP 562), so callers only pay for the parts of the package they use.
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
 
-# === PAYMENT MODULE ===
-from .payment import (
-    request_payment,
-    release_payment,
-    get_payment,
-    get_payments,
-    list_payments,
-    total_paid,
-    total_outstanding,
-    emit_payment_receipt,
-)
+__all__ = ["__version__", *_LAZY]
 
-# === RECONCILE MODULE ===
-from .reconcile import (
-    check_variance,
-    variance_report,
-    flag_contracts,
-    reconcile_contract,
-    reconcile_all,
-    flag_anomaly,
-    get_waste_summary,
-    emit_variance_receipt,
-)
 
-# === DASHBOARD MODULE ===
-from .dashboard import (
-    export_dashboard,
-    dashboard_summary,
-    contracts_by_status,
-    generate_summary,
-    contract_status,
-    export_csv,
-    export_json,
-    format_currency,
-    print_dashboard,
-    serve,
-    check,
-    emit_dashboard_receipt,
-)
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        if name in _EXPORTS:
+            return importlib.import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-# === SCENARIOS MODULE ===
-from .scenarios import (
-    run_baseline_scenario,
-    run_stress_scenario,
-)
 
-__all__ = [
-    # Version
-    "__version__",
-    # Core Constants
-    "TENANT_ID",
-    "VERSION",
-    "DISCLAIMER",
-    "RECEIPT_TYPES",
-    "MILESTONE_STATES",
-    "VARIANCE_THRESHOLD",
-    "LEDGER_PATH",
-    # Core Utils
-    "dual_hash",
-    "merkle",
-    "StopRule",
-    "StopRuleException",
-    "validate_hash",
-    "timestamp_iso",
-    "generate_id",
-    # Core Receipt
-    "emit_receipt",
-    "validate_receipt",
-    "load_receipts",
-    "append_receipt",
-    # Core Ledger
-    "load_ledger",
-    "query_receipts",
-    "clear_ledger",
-    "get_ledger",
-    "add_to_ledger",
-    "anchor_batch",
-    "get_by_type",
-    "get_by_id",
-    # Core Anchor
-    "anchor_receipt",
-    "anchor_chain",
-    "verify_anchor",
-    # Core Gate
-    "check_t2h",
-    "check_t24h",
-    "check_t48h",
-    "gate_status",
-    # Contract
-    "register_contract",
-    "get_contract",
-    "list_contracts",
-    "get_contract_milestones",
-    "update_contract",
-    "emit_contract_receipt",
-    # Milestone
-    "submit_milestone",
-    "submit_deliverable",
-    "verify_milestone",
-    "get_milestone",
-    "list_milestones",
-    "list_pending",
-    "list_verified",
-    "list_disputed",
-    "emit_milestone_receipt",
-    # Payment
-    "request_payment",
-    "release_payment",
-    "get_payment",
-    "get_payments",
-    "list_payments",
-    "total_paid",
-    "total_outstanding",
-    "emit_payment_receipt",
-    # Reconcile
-    "check_variance",
-    "variance_report",
-    "flag_contracts",
-    "reconcile_contract",
-    "reconcile_all",
-    "flag_anomaly",
-    "get_waste_summary",
-    "emit_variance_receipt",
-    # Dashboard
-    "export_dashboard",
-    "dashboard_summary",
-    "contracts_by_status",
-    "generate_summary",
-    "contract_status",
-    "export_csv",
-    "export_json",
-    "format_currency",
-    "print_dashboard",
-    "serve",
-    "check",
-    "emit_dashboard_receipt",
-    # Scenarios
-    "run_baseline_scenario",
-    "run_stress_scenario",
-]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -27,6 +27,7 @@ def emit_contract_receipt(contract: dict) -> dict:
         "contractor_name": str,
         "contract_type": str,
         "total_value_usd": float,
+        "amount_cents": int,
         "milestone_count": int,
         "start_date": str,
         "end_date": str
@@ -40,6 +41,7 @@ def emit_contract_receipt(contract: dict) -> dict:
         "contract_type": contract.get("contract_type", "fixed-price"),
         "amount_fixed": contract.get("amount_fixed", contract.get("total_value_usd")),
         "total_value_usd": contract.get("total_value_usd", contract.get("amount_fixed")),
+        "amount_cents": contract.get("amount_cents"),
         "milestones": contract.get("milestones", []),
         "milestone_count": contract.get("milestone_count", len(contract.get("milestones", []))),
         "terms_hash": contract.get("terms_hash"),
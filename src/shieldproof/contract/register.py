@@ -6,9 +6,16 @@ THIS IS A SIMULATION FOR ACADEMIC RESEARCH PURPOSES ONLY
 
 import json
 import uuid
+from functools import lru_cache
 from typing import Optional
 
-from ..core import dual_hash, query_receipts, StopRule
+from ..core import (
+    dual_hash_bytes,
+    distinct_values,
+    get_latest_by_field,
+    StopRule,
+)
+from ..core.ledger import _copy_receipt, _latest_by_field, _query_receipts
 from .receipts import emit_contract_receipt
 
 
@@ -42,33 +49,37 @@ def register_contract(
         contract_id = f"C-{uuid.uuid4().hex[:12].upper()}"
 
     # Stoprule: Check for duplicate
-    existing = query_receipts("contract", contract_id=contract_id)
-    if existing:
+    if contract_id in distinct_values("contract", "contract_id"):
         _stoprule_duplicate_contract(contract_id)
 
     # Stoprule: Validate amount
     if amount <= 0:
         _stoprule_invalid_amount(contract_id, "Amount must be positive")
 
-    # Stoprule: Validate milestones sum to amount
-    milestone_sum = sum(m.get("amount", 0) for m in milestones)
-    if abs(milestone_sum - amount) > 0.01:  # Allow for floating point tolerance
-        _stoprule_invalid_amount(
-            contract_id,
-            f"Milestone sum ({milestone_sum}) does not equal contract amount ({amount})"
-        )
-
-    # Normalize milestones with PENDING status
+    # Normalize milestones with PENDING status, summing exact cents in the same pass
+    amount_cents = _to_cents(amount)
     normalized_milestones = []
-    for m in milestones:
+    milestone_sum = 0
+    sum_cents = 0
+    for i, m in enumerate(milestones, 1):
+        m_amount = m.get("amount", 0)
+        milestone_sum += m_amount
+        sum_cents += _to_cents(m_amount)
         normalized_milestones.append({
-            "id": m.get("id", f"M{len(normalized_milestones)+1}"),
+            "id": m.get("id", f"M{i}"),
             "description": m.get("description", ""),
-            "amount": m.get("amount", 0),
+            "amount": m_amount,
             "due_date": m.get("due_date"),
             "status": "PENDING",
         })
 
+    # Stoprule: Validate milestones sum to amount
+    if sum_cents != amount_cents:
+        _stoprule_invalid_amount(
+            contract_id,
+            f"Milestone sum ({milestone_sum}) does not equal contract amount ({amount})"
+        )
+
     # Create contract receipt
     receipt = emit_contract_receipt({
         "contract_id": contract_id,
@@ -77,9 +88,10 @@ def register_contract(
         "contract_type": contract_type,
         "amount_fixed": amount,
         "total_value_usd": amount,  # v2.1 field name
+        "amount_cents": amount_cents,
         "milestones": normalized_milestones,
         "milestone_count": len(normalized_milestones),
-        "terms_hash": dual_hash(json.dumps(terms, sort_keys=True)),
+        "terms_hash": _terms_hash(json.dumps(terms, sort_keys=True)),
         "start_date": terms.get("start_date"),
         "end_date": terms.get("end_date"),
     })
@@ -87,6 +99,17 @@ def register_contract(
     return receipt
 
 
+@lru_cache(maxsize=1024)
+def _terms_hash(canonical_terms: str) -> str:
+    """Dual hash of canonical terms JSON; boilerplate terms hash once."""
+    return dual_hash_bytes(canonical_terms.encode('utf-8'))
+
+
+def _to_cents(amount: float) -> int:
+    """Round a dollar amount to integer cents for exact comparison."""
+    return int(round(amount * 100))
+
+
 def get_contract(contract_id: str) -> Optional[dict]:
     """
     Retrieve contract by ID.
@@ -97,11 +120,8 @@ def get_contract(contract_id: str) -> Optional[dict]:
     Returns:
         Contract receipt or None if not found
     """
-    contracts = query_receipts("contract", contract_id=contract_id)
-    if not contracts:
-        return None
     # Return the most recent contract receipt (in case of updates)
-    return contracts[-1]
+    return get_latest_by_field("contract_id", contract_id, "contract")
 
 
 def list_contracts(status: Optional[str] = None, contract_type: Optional[str] = None) -> list:
@@ -115,22 +135,12 @@ def list_contracts(status: Optional[str] = None, contract_type: Optional[str] =
     Returns:
         List of contract receipts
     """
-    contracts = query_receipts("contract")
-
-    if contract_type is not None:
-        contracts = [c for c in contracts if c.get("contract_type") == contract_type]
-
-    if status is None:
-        return contracts
-
-    # Filter by contracts that have at least one milestone with the given status
-    filtered = []
-    for contract in contracts:
-        milestones = contract.get("milestones", [])
-        if any(m.get("status") == status for m in milestones):
-            filtered.append(contract)
-
-    return filtered
+    # One pass over the shared receipts; only matches are copied out
+    return [
+        _copy_receipt(c) for c in _query_receipts("contract")
+        if (contract_type is None or c.get("contract_type") == contract_type)
+        and (status is None or any(m.get("status") == status for m in c.get("milestones", ())))
+    ]
 
 
 def get_contract_milestones(contract_id: str) -> list:
@@ -144,27 +154,28 @@ def get_contract_milestones(contract_id: str) -> list:
     Returns:
         List of milestone dicts with current status
     """
-    contract = get_contract(contract_id)
+    contract = _latest_by_field("contract_id", contract_id, "contract")
     if not contract:
         return []
 
-    # Start with contract milestones
-    milestones = {m["id"]: m.copy() for m in contract.get("milestones", [])}
+    # Contract milestones by id (later duplicates win, as before)
+    milestones = {m["id"]: m for m in contract.get("milestones", [])}
 
-    # Update with milestone receipts
-    milestone_receipts = query_receipts("milestone", contract_id=contract_id)
-    for mr in milestone_receipts:
+    # Collect receipt updates per milestone in ledger order
+    updates = {}
+    for mr in _query_receipts("milestone", contract_id=contract_id):
         mid = mr.get("milestone_id")
-        if mid in milestones:
-            milestones[mid]["status"] = mr.get("status", milestones[mid]["status"])
-            if mr.get("deliverable_hash"):
-                milestones[mid]["deliverable_hash"] = mr["deliverable_hash"]
-            if mr.get("verifier_id"):
-                milestones[mid]["verifier_id"] = mr["verifier_id"]
-            if mr.get("verification_ts"):
-                milestones[mid]["verification_ts"] = mr["verification_ts"]
+        if mid not in milestones:
+            continue
+        update = updates.setdefault(mid, {})
+        if "status" in mr:
+            update["status"] = mr["status"]
+        for field in ("deliverable_hash", "verifier_id", "verification_ts"):
+            if mr.get(field):
+                update[field] = mr[field]
 
-    return list(milestones.values())
+    # Fresh dicts; the contract receipt is shared with the ledger cache
+    return [{**m, **updates.get(mid, {})} for mid, m in milestones.items()]
 
 
 def update_contract(contract_id: str, updates: dict) -> dict:
@@ -182,8 +193,13 @@ def update_contract(contract_id: str, updates: dict) -> dict:
     if not contract:
         _stoprule_unknown_contract(contract_id)
 
-    # Merge updates
+    # Merge updates, keeping amount_cents in step with a changed amount
     updated = {**contract, **updates, "contract_id": contract_id}
+    if "amount_cents" not in updates:
+        for field in ("amount_fixed", "total_value_usd"):
+            if updates.get(field) is not None:
+                updated["amount_cents"] = _to_cents(updates[field])
+                break
 
     # Emit new receipt
     receipt = emit_contract_receipt(updated)
@@ -14,135 +14,105 @@ This module provides the foundation for all SHIELDPROOF operations:
 "One receipt. One milestone. One truth."
 """
 
-from .constants import (
-    TENANT_ID,
-    VERSION,
-    DISCLAIMER,
-    RECEIPT_TYPES,
-    MILESTONE_STATES,
-    VARIANCE_THRESHOLD,
-    VARIANCE_CRITICAL,
-    ANCHOR_BATCH_SIZE,
-    GATE_T2H_SECONDS,
-    GATE_T24H_SECONDS,
-    GATE_T48H_SECONDS,
-    HASH_ALGORITHM_PRIMARY,
-    HASH_ALGORITHM_SECONDARY,
-    HASH_FORMAT,
-    RECEIPT_STORAGE,
-    LEDGER_PATH,
-    SLO_CONTRACT_REGISTER_MS,
-    SLO_PAYMENT_RELEASE_MS,
-    SLO_DASHBOARD_EXPORT_MS,
-    SLO_MILESTONE_VERIFY_MS,
-    MODULE_ID_CORE,
-    MODULE_ID_CONTRACT,
-    MODULE_ID_MILESTONE,
-    MODULE_ID_PAYMENT,
-    MODULE_ID_RECONCILE,
-    MODULE_ID_DASHBOARD,
-    MODULE_ID_SCENARIOS,
-)
+import importlib
 
-from .utils import (
-    dual_hash,
-    merkle,
-    StopRule,
-    StopRuleException,
-    validate_hash,
-    timestamp_iso,
-    generate_id,
-)
+# Public names re-exported from each submodule. Listed once here; __all__
+# and the lazy lookup below are generated from this table.
+_EXPORTS = {
+    "constants": (
+        "TENANT_ID",
+        "VERSION",
+        "DISCLAIMER",
+        "RECEIPT_TYPES",
+        "MILESTONE_STATES",
+        "VARIANCE_THRESHOLD",
+        "VARIANCE_CRITICAL",
+        "ANCHOR_BATCH_SIZE",
+        "GATE_T2H_SECONDS",
+        "GATE_T24H_SECONDS",
+        "GATE_T48H_SECONDS",
+        "HASH_ALGORITHM_PRIMARY",
+        "HASH_ALGORITHM_SECONDARY",
+        "HASH_FORMAT",
+        "RECEIPT_STORAGE",
+        "RECEIPT_FORMATS",
+        "LEDGER_PATH",
+        "SLO_CONTRACT_REGISTER_MS",
+        "SLO_PAYMENT_RELEASE_MS",
+        "SLO_DASHBOARD_EXPORT_MS",
+        "SLO_MILESTONE_VERIFY_MS",
+        "MODULE_ID_CORE",
+        "MODULE_ID_CONTRACT",
+        "MODULE_ID_MILESTONE",
+        "MODULE_ID_PAYMENT",
+        "MODULE_ID_RECONCILE",
+        "MODULE_ID_DASHBOARD",
+        "MODULE_ID_SCENARIOS",
+    ),
+    "utils": (
+        "dual_hash",
+        "dual_hash_bytes",
+        "merkle",
+        "merkle_parallel",
+        "IncrementalMerkle",
+        "StopRule",
+        "StopRuleException",
+        "validate_hash",
+        "timestamp_iso",
+        "generate_id",
+    ),
+    "receipt": (
+        "emit_receipt",
+        "emit_receipts_batch",
+        "set_stdout_default",
+        "validate_receipt",
+        "load_receipts",
+        "append_receipt",
+    ),
+    "ledger": (
+        "load_ledger",
+        "query_receipts",
+        "clear_ledger",
+        "invalidate_cache",
+        "distinct_values",
+        "get_latest_by_field",
+        "get_ledger",
+        "add_to_ledger",
+        "anchor_batch",
+        "get_by_type",
+        "get_by_id",
+    ),
+    "anchor": (
+        "anchor_receipt",
+        "anchor_chain",
+        "verify_anchor",
+    ),
+    "gate": (
+        "check_t2h",
+        "check_t24h",
+        "check_t48h",
+        "gate_status",
+        "gate_clear_cache",
+    ),
+}
 
-from .receipt import (
-    emit_receipt,
-    validate_receipt,
-    load_receipts,
-    append_receipt,
-)
+# Name -> submodule. Submodules are imported on first attribute access
+# (PEP 562), so `from ..core import X` only loads the module defining X.
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
 
-from .ledger import (
-    load_ledger,
-    query_receipts,
-    clear_ledger,
-    get_ledger,
-    add_to_ledger,
-    anchor_batch,
-    get_by_type,
-    get_by_id,
-)
+__all__ = list(_LAZY)
 
-from .anchor import (
-    anchor_receipt,
-    anchor_chain,
-    verify_anchor,
-)
 
-from .gate import (
-    check_t2h,
-    check_t24h,
-    check_t48h,
-    gate_status,
-)
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        if name in _EXPORTS:
+            return importlib.import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-__all__ = [
-    # Constants
-    "TENANT_ID",
-    "VERSION",
-    "DISCLAIMER",
-    "RECEIPT_TYPES",
-    "MILESTONE_STATES",
-    "VARIANCE_THRESHOLD",
-    "VARIANCE_CRITICAL",
-    "ANCHOR_BATCH_SIZE",
-    "GATE_T2H_SECONDS",
-    "GATE_T24H_SECONDS",
-    "GATE_T48H_SECONDS",
-    "HASH_ALGORITHM_PRIMARY",
-    "HASH_ALGORITHM_SECONDARY",
-    "HASH_FORMAT",
-    "RECEIPT_STORAGE",
-    "LEDGER_PATH",
-    "SLO_CONTRACT_REGISTER_MS",
-    "SLO_PAYMENT_RELEASE_MS",
-    "SLO_DASHBOARD_EXPORT_MS",
-    "SLO_MILESTONE_VERIFY_MS",
-    "MODULE_ID_CORE",
-    "MODULE_ID_CONTRACT",
-    "MODULE_ID_MILESTONE",
-    "MODULE_ID_PAYMENT",
-    "MODULE_ID_RECONCILE",
-    "MODULE_ID_DASHBOARD",
-    "MODULE_ID_SCENARIOS",
-    # Utils
-    "dual_hash",
-    "merkle",
-    "StopRule",
-    "StopRuleException",
-    "validate_hash",
-    "timestamp_iso",
-    "generate_id",
-    # Receipt
-    "emit_receipt",
-    "validate_receipt",
-    "load_receipts",
-    "append_receipt",
-    # Ledger
-    "load_ledger",
-    "query_receipts",
-    "clear_ledger",
-    "get_ledger",
-    "add_to_ledger",
-    "anchor_batch",
-    "get_by_type",
-    "get_by_id",
-    # Anchor
-    "anchor_receipt",
-    "anchor_chain",
-    "verify_anchor",
-    # Gate
-    "check_t2h",
-    "check_t24h",
-    "check_t48h",
-    "gate_status",
-]
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
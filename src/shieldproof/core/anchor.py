@@ -9,12 +9,22 @@ Provides:
 - verify_anchor: Verify receipt against anchor
 """
 
-import json
 from typing import Optional
 
 from .constants import TENANT_ID
 from .receipt import emit_receipt
-from .utils import dual_hash, merkle
+from .utils import (
+    MERKLE_PARALLEL_MIN_LEAVES,
+    dual_hash_bytes,
+    merkle,
+    merkle_parallel,
+    _sorted_json,
+)
+
+
+def _receipt_hash(receipt: dict) -> str:
+    """Dual hash of a receipt's sorted-key JSON."""
+    return dual_hash_bytes(_sorted_json(receipt).encode('utf-8'))
 
 
 def anchor_receipt(receipt: dict, storage_path: Optional[str] = None) -> dict:
@@ -29,7 +39,7 @@ def anchor_receipt(receipt: dict, storage_path: Optional[str] = None) -> dict:
         Anchor receipt
     """
     # Compute hash of the receipt
-    receipt_hash = dual_hash(json.dumps(receipt, sort_keys=True))
+    receipt_hash = _receipt_hash(receipt)
 
     anchor = emit_receipt("anchor", {
         "tenant_id": receipt.get("tenant_id", TENANT_ID),
@@ -53,8 +63,11 @@ def anchor_chain(receipts: list, storage_path: Optional[str] = None) -> dict:
     Returns:
         Chain anchor receipt
     """
-    # Compute Merkle root
-    root = merkle(receipts)
+    # Compute Merkle root; large batches hash subtrees across processes
+    if len(receipts) >= MERKLE_PARALLEL_MIN_LEAVES:
+        root = merkle_parallel(receipts)
+    else:
+        root = merkle(receipts)
 
     # Get receipt IDs
     receipt_ids = []
@@ -91,7 +104,7 @@ def verify_anchor(receipt: dict, anchor: dict) -> bool:
     if anchor_type == "single":
         # Verify single receipt hash
         expected_hash = anchor.get("receipt_hash")
-        actual_hash = dual_hash(json.dumps(receipt, sort_keys=True))
+        actual_hash = _receipt_hash(receipt)
         return expected_hash == actual_hash
 
     elif anchor_type == "chain":
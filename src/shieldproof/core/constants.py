@@ -52,6 +52,7 @@ HASH_FORMAT = "{sha256}:{blake3}"
 # STORAGE
 # =============================================================================
 RECEIPT_STORAGE = "receipts.jsonl"
+RECEIPT_FORMATS = ["json", "cbor"]  # Stdout encodings; ledger stays JSONL
 LEDGER_PATH = Path(__file__).parent.parent.parent.parent / "shieldproof_receipts.jsonl"
 
 # =============================================================================
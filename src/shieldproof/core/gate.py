@@ -8,13 +8,34 @@ Provides:
 - check_t24h: Run T+24h MVP checks (includes t2h)
 - check_t48h: Run T+48h hardened checks (includes t24h)
 - gate_status: Return current gate status
+- gate_clear_cache: Forget cached gate results
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+def _resolve_base(base_path: Optional[str]) -> str:
+    """Normalize base_path to a cache key (default: project root)."""
+    if base_path is None:
+        return str(Path(__file__).parent.parent.parent.parent)
+    return str(Path(base_path))
+
+
+def _copy_result(result: dict) -> dict:
+    """Copy a cached result so callers can modify it freely."""
+    return {**result, "checks": [dict(c) for c in result["checks"]]}
+
+
+def gate_clear_cache() -> None:
+    """Forget cached gate results so the next check re-runs."""
+    _check_t2h_impl.cache_clear()
+    _check_t24h_impl.cache_clear()
+    _check_t48h_impl.cache_clear()
+
+
 def check_t2h(base_path: Optional[str] = None) -> dict:
     """
     Run T+2h skeleton checks.
@@ -31,12 +52,13 @@ def check_t2h(base_path: Optional[str] = None) -> dict:
     Returns:
         {"passed": bool, "checks": list}
     """
-    # Default to project root (parent of src/shieldproof)
-    if base_path is None:
-        base_path = Path(__file__).parent.parent.parent.parent
-    else:
-        base_path = Path(base_path)
+    return _copy_result(_check_t2h_impl(_resolve_base(base_path)))
+
 
+@lru_cache(maxsize=32)
+def _check_t2h_impl(base: str) -> dict:
+    """Cached body of check_t2h for a resolved base path."""
+    base_path = Path(base)
     checks = []
     passed = True
 
@@ -91,8 +113,14 @@ def check_t24h(base_path: Optional[str] = None) -> dict:
     Returns:
         {"passed": bool, "checks": list}
     """
+    return _copy_result(_check_t24h_impl(_resolve_base(base_path)))
+
+
+@lru_cache(maxsize=32)
+def _check_t24h_impl(base: str) -> dict:
+    """Cached body of check_t24h for a resolved base path."""
     # Run t2h first
-    t2h_result = check_t2h(base_path)
+    t2h_result = _check_t2h_impl(base)
     checks = t2h_result["checks"].copy()
     passed = t2h_result["passed"]
 
@@ -127,8 +155,14 @@ def check_t48h(base_path: Optional[str] = None) -> dict:
     Returns:
         {"passed": bool, "checks": list}
     """
+    return _copy_result(_check_t48h_impl(_resolve_base(base_path)))
+
+
+@lru_cache(maxsize=32)
+def _check_t48h_impl(base: str) -> dict:
+    """Cached body of check_t48h for a resolved base path."""
     # Run t24h first
-    t24h_result = check_t24h(base_path)
+    t24h_result = _check_t24h_impl(base)
     checks = t24h_result["checks"].copy()
     passed = t24h_result["passed"]
 
@@ -148,17 +182,26 @@ def check_t48h(base_path: Optional[str] = None) -> dict:
     return {"passed": passed, "checks": checks, "gate": "t48h"}
 
 
-def gate_status(gate_name: str, base_path: Optional[str] = None) -> dict:
+def gate_status(
+    gate_name: str,
+    base_path: Optional[str] = None,
+    force: bool = False,
+) -> dict:
     """
     Return current gate status.
 
+    Results are cached per base path; force re-runs every check.
+
     Args:
         gate_name: Gate to check ("t2h", "t24h", "t48h")
         base_path: Base path for shieldproof
+        force: Clear cached results first
 
     Returns:
         Gate status dict
     """
+    if force:
+        gate_clear_cache()
     if gate_name == "t2h":
         return check_t2h(base_path)
     elif gate_name == "t24h":
@@ -7,6 +7,9 @@ Provides:
 - load_ledger: Load all receipts from storage
 - query_receipts: Query receipts with filters
 - clear_ledger: Clear all receipts from storage
+- invalidate_cache: Drop the in-memory ledger
+- distinct_values: Set of a field's values across one receipt type
+- get_latest_by_field: Most recent receipt with a field value
 - get_ledger: Alias for load_ledger
 - add_to_ledger: Add receipt to ledger
 - anchor_batch: Compute Merkle root, emit anchor_receipt
@@ -14,13 +17,193 @@ Provides:
 - get_by_id: Get single receipt by ID
 """
 
-import json
 import os
+import sys
+import threading
 from typing import Optional
 
 from .constants import LEDGER_PATH, ANCHOR_BATCH_SIZE, TENANT_ID
-from .receipt import emit_receipt, load_receipts, append_receipt
-from .utils import merkle
+from .receipt import (
+    emit_receipt,
+    append_receipt,
+    _close_ledger_files,
+    _parse_receipt_lines,
+)
+from .utils import merkle, IncrementalMerkle
+
+
+# Receipt fields with equality indexes for query_receipts
+_INDEXED_FIELDS = ("contract_id", "milestone_id")
+
+# String fields repeated across many receipts; the cache shares one copy
+_INTERNED_FIELDS = ("receipt_type", "tenant_id") + _INDEXED_FIELDS
+
+
+# Bytes kept from the start and the end of the parsed region; a grown
+# file that differs there was rewritten in place, not appended to
+_FINGERPRINT_BYTES = 4096
+
+
+def _copy_receipt(value):
+    """Deep copy of a parsed receipt (dicts, lists and JSON scalars)."""
+    if type(value) is dict:
+        return {k: _copy_receipt(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_receipt(v) for v in value]
+    return value
+
+
+def _hashable(value) -> bool:
+    """True if value can be an index key."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class _LedgerCache:
+    """
+    Receipts parsed from one ledger file, the byte offset they reach, the
+    first and last bytes of the parsed region, and equality indexes of
+    list positions kept in ledger order.
+    """
+
+    __slots__ = (
+        "receipts", "offset", "ino", "mtime_ns", "head", "edge",
+        "by_type", "by_id", "by_field", "distinct", "merkle",
+    )
+
+    def __init__(self, ino: int):
+        self.receipts = []
+        self.offset = 0
+        self.ino = ino
+        self.mtime_ns = None
+        self.head = b""
+        self.edge = b""
+        self.by_type = {}
+        self.by_id = {}
+        self.by_field = {name: {} for name in _INDEXED_FIELDS}
+        self.distinct = {}
+        self.merkle = None
+
+    def extend(self, receipts: list) -> None:
+        """Append parsed receipts, intern repeated values and index them."""
+        for pos, receipt in enumerate(receipts, len(self.receipts)):
+            for name in _INTERNED_FIELDS:
+                value = receipt.get(name)
+                if type(value) is str:
+                    receipt[name] = sys.intern(value)
+            self.receipts.append(receipt)
+            receipt_type = receipt.get("receipt_type")
+            if _hashable(receipt_type):
+                self.by_type.setdefault(receipt_type, []).append(pos)
+            # First receipt whose receipt_id or payload_hash matches wins
+            for key in (receipt.get("receipt_id"), receipt.get("payload_hash")):
+                if key is not None and _hashable(key):
+                    self.by_id.setdefault(key, pos)
+            for name, index in self.by_field.items():
+                value = receipt.get(name)
+                if value is not None and _hashable(value):
+                    index.setdefault(value, []).append(pos)
+
+    def advance(self, region: bytes) -> None:
+        """Move past region, keeping its bytes for the rewrite check."""
+        self.offset += len(region)
+        if len(self.head) < _FINGERPRINT_BYTES:
+            self.head += region[:_FINGERPRINT_BYTES - len(self.head)]
+        self.edge = (self.edge + region[-_FINGERPRINT_BYTES:])[-_FINGERPRINT_BYTES:]
+
+    def matches(self, f) -> bool:
+        """True if file f still holds the cached first and last bytes."""
+        if f.read(len(self.head)) != self.head:
+            return False
+        f.seek(self.offset - len(self.edge))
+        return f.read(len(self.edge)) == self.edge
+
+
+# In-memory ledgers by path; appends are parsed from the cached offset on
+_LEDGER_CACHE = {}
+_LEDGER_LOCK = threading.Lock()
+
+
+def _ledger_cache(path) -> Optional[_LedgerCache]:
+    """
+    Return the in-memory ledger for path, parsing only new appends.
+
+    The ledger is append-only, so a file that grew is read from the
+    cached offset once its first and last parsed bytes are confirmed
+    unchanged. A replaced, truncated or rewritten file is re-parsed in
+    full. A trailing partial line is left for the next read.
+
+    Args:
+        path: Path to JSONL ledger file
+
+    Returns:
+        Shared cache (callers must not mutate it), or None if no file
+    """
+    path = str(path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _LEDGER_CACHE.pop(path, None)
+        return None
+
+    with _LEDGER_LOCK:
+        cache = _LEDGER_CACHE.get(path)
+        if (
+            cache is None
+            or cache.ino != st.st_ino
+            or st.st_size < cache.offset
+            or (st.st_size == cache.offset and st.st_mtime_ns != cache.mtime_ns)
+        ):
+            cache = _LEDGER_CACHE[path] = _LedgerCache(st.st_ino)
+
+        if st.st_size > cache.offset:
+            with open(path, "rb") as f:
+                if cache.offset and not cache.matches(f):
+                    # Rewritten in place and grown: start over
+                    cache = _LEDGER_CACHE[path] = _LedgerCache(st.st_ino)
+                f.seek(cache.offset)
+                tail = f.read()
+            end = tail.rfind(b"\n") + 1
+            cache.extend(_parse_receipt_lines(tail[:end].splitlines()))
+            cache.advance(tail[:end])
+        cache.mtime_ns = st.st_mtime_ns
+        return cache
+
+
+def _ledger_receipts(path) -> list:
+    """Return the shared cached receipt list for path (do not mutate)."""
+    cache = _ledger_cache(path)
+    return cache.receipts if cache is not None else []
+
+
+def _read_ledger(path) -> list:
+    """
+    Return receipts at path, re-parsing only what was appended.
+
+    Args:
+        path: Path to JSONL ledger file
+
+    Returns:
+        List of receipt dicts (copies; safe to modify)
+    """
+    return [_copy_receipt(r) for r in _ledger_receipts(path)]
+
+
+def invalidate_cache(path: Optional[str] = None) -> None:
+    """
+    Drop the in-memory ledger so the next read re-parses the file.
+
+    Args:
+        path: Ledger path to drop (default: every cached ledger)
+    """
+    with _LEDGER_LOCK:
+        if path is None:
+            _LEDGER_CACHE.clear()
+        else:
+            _LEDGER_CACHE.pop(str(path), None)
 
 
 def load_ledger() -> list:
@@ -30,7 +213,7 @@ def load_ledger() -> list:
     Returns:
         List of receipt dicts
     """
-    return load_receipts(LEDGER_PATH)
+    return _read_ledger(LEDGER_PATH)
 
 
 def query_receipts(receipt_type: Optional[str] = None, **filters) -> list:
@@ -42,9 +225,30 @@ def query_receipts(receipt_type: Optional[str] = None, **filters) -> list:
         **filters: Additional field filters
 
     Returns:
-        List of matching receipts
+        List of matching receipts (copies; safe to modify)
     """
-    receipts = load_ledger()
+    return [_copy_receipt(r) for r in _query_receipts(receipt_type, **filters)]
+
+
+def _query_receipts(receipt_type: Optional[str] = None, **filters) -> list:
+    """query_receipts returning the shared cached receipts (do not mutate)."""
+    cache = _ledger_cache(LEDGER_PATH)
+    if cache is None:
+        return []
+
+    # Narrow to the shortest indexed posting list, then check each filter
+    postings = []
+    if receipt_type:
+        postings.append(cache.by_type.get(receipt_type, ()))
+    for key, value in filters.items():
+        index = cache.by_field.get(key)
+        if index is not None and value is not None and _hashable(value):
+            postings.append(index.get(value, ()))
+
+    if postings:
+        receipts = [cache.receipts[i] for i in min(postings, key=len)]
+    else:
+        receipts = list(cache.receipts)
 
     if receipt_type:
         receipts = [r for r in receipts if r.get("receipt_type") == receipt_type]
@@ -55,6 +259,78 @@ def query_receipts(receipt_type: Optional[str] = None, **filters) -> list:
     return receipts
 
 
+def get_latest_by_field(
+    field: str,
+    value,
+    receipt_type: Optional[str] = None,
+) -> Optional[dict]:
+    """
+    Most recent receipt whose field equals value.
+
+    Walks the field's index (or the ledger) from the end and stops at
+    the first match, so older versions are never collected.
+
+    Args:
+        field: Receipt field to match
+        value: Value to match
+        receipt_type: Optional receipt type filter
+
+    Returns:
+        Receipt dict (a copy) or None if not found
+    """
+    receipt = _latest_by_field(field, value, receipt_type)
+    return _copy_receipt(receipt) if receipt is not None else None
+
+
+def _latest_by_field(field: str, value, receipt_type: Optional[str] = None) -> Optional[dict]:
+    """get_latest_by_field returning the shared cached receipt (do not mutate)."""
+    cache = _ledger_cache(LEDGER_PATH)
+    if cache is None:
+        return None
+
+    index = cache.by_field.get(field)
+    if index is not None and value is not None and _hashable(value):
+        candidates = (cache.receipts[i] for i in reversed(index.get(value, ())))
+    else:
+        candidates = reversed(cache.receipts)
+
+    for receipt in candidates:
+        if receipt.get(field) == value and (
+            not receipt_type or receipt.get("receipt_type") == receipt_type
+        ):
+            return receipt
+    return None
+
+
+def distinct_values(receipt_type: str, field: str) -> set:
+    """
+    Values of field across receipts of receipt_type in the ledger.
+
+    The set is kept with the in-memory ledger and extended from new
+    appends only, so membership checks stay O(1) as the ledger grows.
+
+    Args:
+        receipt_type: Receipt type to collect from
+        field: Receipt field to collect
+
+    Returns:
+        Shared cached set; callers must not mutate it
+    """
+    cache = _ledger_cache(LEDGER_PATH)
+    if cache is None:
+        return set()
+
+    with _LEDGER_LOCK:
+        values, seen = cache.distinct.get((receipt_type, field), (set(), 0))
+        positions = cache.by_type.get(receipt_type, ())
+        for i in positions[seen:]:
+            value = cache.receipts[i].get(field)
+            if value is not None and _hashable(value):
+                values.add(value)
+        cache.distinct[(receipt_type, field)] = (values, len(positions))
+    return values
+
+
 def clear_ledger(path: Optional[str] = None) -> None:
     """
     Clear the ledger file. Use only for testing.
@@ -63,8 +339,10 @@ def clear_ledger(path: Optional[str] = None) -> None:
         path: Optional path to ledger file
     """
     storage_path = path or LEDGER_PATH
+    _close_ledger_files(storage_path)
     if os.path.exists(storage_path):
         os.remove(storage_path)
+    invalidate_cache(storage_path)
 
 
 # Aliases for v2.1 API
@@ -79,7 +357,7 @@ def get_ledger(path: Optional[str] = None) -> list:
     Returns:
         List of all receipts
     """
-    return load_receipts(path or LEDGER_PATH)
+    return _read_ledger(path or LEDGER_PATH)
 
 
 def add_to_ledger(receipt: dict, path: Optional[str] = None) -> str:
@@ -97,29 +375,49 @@ def add_to_ledger(receipt: dict, path: Optional[str] = None) -> str:
     return receipt.get("receipt_id", receipt.get("payload_hash", ""))
 
 
-def anchor_batch(receipts: list, path: Optional[str] = None) -> dict:
+def anchor_batch(receipts: Optional[list] = None, path: Optional[str] = None) -> dict:
     """
     Compute Merkle root for batch, emit anchor_receipt.
 
+    With no receipts, anchors the whole ledger. Its Merkle accumulator is
+    kept with the in-memory ledger, so only receipts appended since the
+    last anchor are hashed.
+
     Args:
-        receipts: List of receipts to anchor
+        receipts: List of receipts to anchor (default: the whole ledger)
         path: Optional path to receipt storage
 
     Returns:
         Anchor receipt
     """
-    root = merkle(receipts)
+    if receipts is None:
+        root, batch_size = _ledger_merkle_root(path or LEDGER_PATH)
+    else:
+        root, batch_size = merkle(receipts), len(receipts)
 
     anchor = emit_receipt("anchor", {
         "tenant_id": TENANT_ID,
         "merkle_root": root,
-        "batch_size": len(receipts),
+        "batch_size": batch_size,
         "hash_algos": ["SHA256", "BLAKE3"],
     }, to_ledger=bool(path))
 
     return anchor
 
 
+def _ledger_merkle_root(path) -> tuple:
+    """Return (merkle root, receipt count) of the ledger at path."""
+    cache = _ledger_cache(path)
+    if cache is None:
+        return merkle([]), 0
+
+    with _LEDGER_LOCK:
+        if cache.merkle is None:
+            cache.merkle = IncrementalMerkle()
+        cache.merkle.extend(cache.receipts[len(cache.merkle):])
+        return cache.merkle.root(), len(cache.merkle)
+
+
 def get_by_type(receipt_type: str, path: Optional[str] = None) -> list:
     """
     Filter receipts by type.
@@ -131,8 +429,10 @@ def get_by_type(receipt_type: str, path: Optional[str] = None) -> list:
     Returns:
         List of matching receipts
     """
-    receipts = load_receipts(path or LEDGER_PATH)
-    return [r for r in receipts if r.get("receipt_type") == receipt_type]
+    cache = _ledger_cache(path or LEDGER_PATH)
+    if cache is None or not _hashable(receipt_type):
+        return []
+    return [_copy_receipt(cache.receipts[i]) for i in cache.by_type.get(receipt_type, ())]
 
 
 def get_by_id(receipt_id: str, path: Optional[str] = None) -> Optional[dict]:
@@ -146,11 +446,8 @@ def get_by_id(receipt_id: str, path: Optional[str] = None) -> Optional[dict]:
     Returns:
         Receipt dict or None if not found
     """
-    receipts = load_receipts(path or LEDGER_PATH)
-    for receipt in receipts:
-        if receipt.get("receipt_id") == receipt_id:
-            return receipt
-        # Also check payload_hash for older receipts without receipt_id
-        if receipt.get("payload_hash") == receipt_id:
-            return receipt
-    return None
+    cache = _ledger_cache(path or LEDGER_PATH)
+    if cache is None or not _hashable(receipt_id):
+        return None
+    pos = cache.by_id.get(receipt_id)
+    return _copy_receipt(cache.receipts[pos]) if pos is not None else None
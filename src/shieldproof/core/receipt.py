@@ -5,63 +5,176 @@ THIS IS A SIMULATION FOR ACADEMIC RESEARCH PURPOSES ONLY
 
 Provides:
 - emit_receipt: Create receipt with ts, tenant_id, payload_hash
+- emit_receipts_batch: Emit many receipts with one write per sink
+- set_stdout_default: Choose whether receipts print by default
 - validate_receipt: Validate receipt has required fields
 - load_receipts: Load receipts from JSONL file
 - append_receipt: Append receipt to JSONL file
 """
 
+import atexit
 import json
 import os
+import re
+import sys
+import threading
 from datetime import datetime
 from typing import Optional
 
-from .constants import TENANT_ID, LEDGER_PATH
-from .utils import dual_hash
+try:
+    import cbor2
+    HAS_CBOR2 = True
+except ImportError:
+    HAS_CBOR2 = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from .constants import TENANT_ID, LEDGER_PATH, RECEIPT_FORMATS
+from .utils import dual_hash_bytes, _sorted_json
+
+
+# Dual-hash payload_hash: lowercase SHA256 hex : lowercase BLAKE3 hex
+_HEX64 = re.compile(r"[0-9a-f]{64}:[0-9a-f]{64}")
+
+
+def _dumps(receipt: dict) -> str:
+    """
+    Encode a receipt as one sorted-key JSON line.
+
+    Always the stdlib encoder: loaded lines feed merkle and anchor
+    hashes, and orjson writes some floats (1e16), NaN and big ints
+    differently, so ledger text would depend on what is installed.
+    """
+    return _sorted_json(receipt)
+
+
+def _loads(line):
+    """Decode one JSON line (str or bytes)."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity from the stdlib encoder
+    return json.loads(line)
+
+
+# Whether emit_receipt prints when to_stdout is not given; the CLI turns
+# this on, library and batch callers keep stdout quiet
+_STDOUT_DEFAULT = False
+
+
+def set_stdout_default(enabled: bool) -> None:
+    """
+    Set whether receipts print to stdout when to_stdout is not given.
+
+    Args:
+        enabled: True to print receipts by default
+    """
+    global _STDOUT_DEFAULT
+    _STDOUT_DEFAULT = bool(enabled)
+
+
+def _build_receipt(receipt_type: str, data: dict) -> dict:
+    """Receipt dict with ts, tenant_id and payload_hash over data."""
+    return {
+        "receipt_type": receipt_type,
+        "ts": datetime.utcnow().isoformat() + "Z",
+        "tenant_id": data.get("tenant_id", TENANT_ID),
+        "payload_hash": dual_hash_bytes(_sorted_json(data).encode('utf-8')),
+        **data
+    }
 
 
 def emit_receipt(
     receipt_type: str,
     data: dict,
-    to_stdout: bool = True,
+    to_stdout: Optional[bool] = None,
     to_ledger: bool = True,
-    storage_path: Optional[str] = None
+    storage_path: Optional[str] = None,
+    format: str = "json",
 ) -> dict:
     """
     Create receipt with ts, tenant_id, payload_hash.
-    Print JSON to stdout. Return receipt dict.
+    Optionally print it to stdout. Return receipt dict.
 
     Args:
         receipt_type: Type of receipt (e.g., "contract", "milestone", "payment")
         data: Receipt-specific fields
-        to_stdout: Whether to print to stdout (default True)
+        to_stdout: Whether to print to stdout (default False; see
+            set_stdout_default)
         to_ledger: Whether to append to ledger file (default True)
         storage_path: Optional custom path to store receipt
+        format: Stdout encoding, "json" or "cbor" (ledger is always JSONL)
 
     Returns:
         Receipt dict with all fields
     """
-    # Create receipt
-    receipt = {
-        "receipt_type": receipt_type,
-        "ts": datetime.utcnow().isoformat() + "Z",
-        "tenant_id": data.get("tenant_id", TENANT_ID),
-        "payload_hash": dual_hash(json.dumps(data, sort_keys=True)),
-        **data
-    }
+    if format not in RECEIPT_FORMATS:
+        raise ValueError(f"Unknown receipt format: {format}")
+    if format == "cbor" and not HAS_CBOR2:
+        raise ImportError("cbor2 is required for format='cbor'")
+    if to_stdout is None:
+        to_stdout = _STDOUT_DEFAULT
+
+    receipt = _build_receipt(receipt_type, data)
 
-    receipt_json = json.dumps(receipt, sort_keys=True)
+    # Encode the line once, and only when something writes it
+    if to_ledger or (to_stdout and format == "json"):
+        receipt_json = _dumps(receipt)
 
     if to_stdout:
-        print(receipt_json, flush=True)
+        if format == "cbor":
+            sys.stdout.flush()
+            sys.stdout.buffer.write(cbor2.dumps(receipt, canonical=True))
+            sys.stdout.buffer.flush()
+        else:
+            print(receipt_json, flush=True)
 
     if to_ledger:
-        path = storage_path or LEDGER_PATH
-        with open(path, "a") as f:
-            f.write(receipt_json + "\n")
+        _append_line(storage_path or LEDGER_PATH, receipt_json)
 
     return receipt
 
 
+def emit_receipts_batch(
+    items,
+    to_stdout: Optional[bool] = None,
+    to_ledger: bool = True,
+    storage_path: Optional[str] = None,
+) -> list:
+    """
+    Emit many receipts with one stdout write and one ledger write.
+
+    Args:
+        items: Iterable of (receipt_type, data) pairs
+        to_stdout: Whether to print the JSON lines (default as emit_receipt)
+        to_ledger: Whether to append to ledger file (default True)
+        storage_path: Optional custom path to store receipts
+
+    Returns:
+        List of receipt dicts, in input order
+    """
+    if to_stdout is None:
+        to_stdout = _STDOUT_DEFAULT
+
+    receipts = [_build_receipt(receipt_type, data) for receipt_type, data in items]
+    if not receipts or not (to_stdout or to_ledger):
+        return receipts
+
+    text = "\n".join(map(_dumps, receipts))
+    if to_stdout:
+        sys.stdout.write(text + "\n")
+        sys.stdout.flush()
+    if to_ledger:
+        _append_line(storage_path or LEDGER_PATH, text)
+
+    return receipts
+
+
 def validate_receipt(receipt: dict) -> bool:
     """
     Validate receipt has required fields and valid hash.
@@ -81,19 +194,7 @@ def validate_receipt(receipt: dict) -> bool:
 
     # Validate hash format (64 hex : 64 hex)
     payload_hash = receipt.get("payload_hash", "")
-    if not isinstance(payload_hash, str) or ":" not in payload_hash:
-        return False
-
-    parts = payload_hash.split(":")
-    if len(parts) != 2:
-        return False
-
-    # Each part should be 64 hex characters
-    for part in parts:
-        if len(part) != 64 or not all(c in '0123456789abcdef' for c in part):
-            return False
-
-    return True
+    return isinstance(payload_hash, str) and _HEX64.fullmatch(payload_hash) is not None
 
 
 def load_receipts(path: Optional[str] = None) -> list:
@@ -111,15 +212,28 @@ def load_receipts(path: Optional[str] = None) -> list:
     if not os.path.exists(path):
         return []
 
+    with open(path, 'rb') as f:
+        return _parse_receipt_lines(f)
+
+
+def _parse_receipt_lines(lines) -> list:
+    """
+    Parse JSONL receipt lines, skipping blank and malformed lines.
+
+    Args:
+        lines: Iterable of str or bytes lines
+
+    Returns:
+        List of receipt dicts
+    """
     receipts = []
-    with open(path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    receipts.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+    for line in lines:
+        line = line.strip()
+        if line:
+            try:
+                receipts.append(_loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
 
     return receipts
 
@@ -132,7 +246,60 @@ def append_receipt(receipt: dict, path: Optional[str] = None) -> None:
         receipt: Receipt dict to append
         path: Path to JSONL file (default: LEDGER_PATH)
     """
-    path = path or LEDGER_PATH
+    _append_line(path or LEDGER_PATH, _dumps(receipt))
+
+
+# Append-mode ledger files kept open across receipts: path -> (file, dev, ino)
+_LEDGER_FILES = {}
+_LEDGER_FILES_LOCK = threading.Lock()
+
+
+def _append_line(path, line: str) -> None:
+    """
+    Append a line (or newline-joined lines) to a ledger file through a
+    cached append-mode handle.
+
+    Each line is flushed so ledger reads see it immediately. The handle
+    is reopened if the file was deleted or replaced since it was opened.
+
+    Args:
+        path: Path to JSONL file
+        line: Text without trailing newline
+    """
+    path = str(path)
+    data = (line + "\n").encode("utf-8")
+    with _LEDGER_FILES_LOCK:
+        entry = _LEDGER_FILES.get(path)
+        if entry is not None:
+            try:
+                st = os.stat(path)
+                current = (st.st_dev, st.st_ino) == entry[1:]
+            except FileNotFoundError:
+                current = False
+            if not current:
+                entry[0].close()
+                entry = None
+        if entry is None:
+            f = open(path, "ab")
+            st = os.fstat(f.fileno())
+            entry = _LEDGER_FILES[path] = (f, st.st_dev, st.st_ino)
+        entry[0].write(data)
+        entry[0].flush()
+
+
+def _close_ledger_files(path: Optional[str] = None) -> None:
+    """
+    Close cached ledger handles.
+
+    Args:
+        path: Ledger path to close (default: all)
+    """
+    with _LEDGER_FILES_LOCK:
+        paths = list(_LEDGER_FILES) if path is None else [str(path)]
+        for p in paths:
+            entry = _LEDGER_FILES.pop(p, None)
+            if entry is not None:
+                entry[0].close()
+
 
-    with open(path, 'a') as f:
-        f.write(json.dumps(receipt, sort_keys=True) + '\n')
+atexit.register(_close_ledger_files)
@@ -5,7 +5,10 @@ THIS IS A SIMULATION FOR ACADEMIC RESEARCH PURPOSES ONLY
 
 Provides:
 - dual_hash: SHA256:BLAKE3 format per CLAUDEME §8
+- dual_hash_bytes: dual_hash for bytes, hashing large inputs concurrently
 - merkle: Compute Merkle root using dual_hash
+- merkle_parallel: merkle() with subtrees hashed in worker processes
+- IncrementalMerkle: Append-only accumulator with the merkle() root
 - StopRule: Exception raised when stoprule triggers
 - validate_hash: Validate dual-hash format
 - timestamp_iso: Return current UTC timestamp in ISO8601 format
@@ -13,10 +16,13 @@ Provides:
 
 import hashlib
 import json
+import os
 import re
+import threading
 import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Union
+from typing import Iterable, Optional, Union
 
 try:
     import blake3
@@ -24,6 +30,11 @@ try:
 except ImportError:
     HAS_BLAKE3 = False
 
+# Constructors bound once; hashlib's sha256 is OpenSSL's, which already
+# picks SHA-NI/ARMv8 SHA instructions when the CPU has them
+_sha256 = hashlib.sha256
+_blake3 = blake3.blake3 if HAS_BLAKE3 else None
+
 
 class StopRuleException(Exception):
     """
@@ -38,6 +49,31 @@ class StopRuleException(Exception):
 StopRule = StopRuleException
 
 
+# Reused encoder; same output as json.dumps(obj, sort_keys=True) without
+# building a JSONEncoder per call
+_sorted_json = json.JSONEncoder(sort_keys=True).encode
+
+# Inputs at least this large hash SHA256 and BLAKE3 concurrently; below
+# it thread dispatch costs more than it saves
+DUAL_HASH_PARALLEL_MIN_BYTES = 1 << 20
+
+# Batches at least this large are worth merkle_parallel's process startup
+# and pickling of leaf bytes
+MERKLE_PARALLEL_MIN_LEAVES = 2048
+
+_SHA_POOL = None
+_SHA_POOL_LOCK = threading.Lock()
+
+
+def _sha_pool() -> ThreadPoolExecutor:
+    """Lazily created single worker for overlapping SHA256 with BLAKE3."""
+    global _SHA_POOL
+    with _SHA_POOL_LOCK:
+        if _SHA_POOL is None:
+            _SHA_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sha256")
+        return _SHA_POOL
+
+
 def dual_hash(data: Union[bytes, str]) -> str:
     """
     SHA256:BLAKE3 - ALWAYS use this, never single hash.
@@ -51,11 +87,36 @@ def dual_hash(data: Union[bytes, str]) -> str:
     Returns:
         String in format "sha256hex:blake3hex"
     """
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    sha = hashlib.sha256(data).hexdigest()
-    b3 = blake3.blake3(data).hexdigest() if HAS_BLAKE3 else sha
-    return f"{sha}:{b3}"
+    return dual_hash_bytes(_as_bytes(data))
+
+
+def _as_bytes(data: Union[bytes, str]) -> bytes:
+    """UTF-8 encode str input; bytes pass through."""
+    return data.encode('utf-8') if isinstance(data, str) else data
+
+
+def dual_hash_bytes(buf: bytes) -> str:
+    """
+    dual_hash for pre-encoded bytes.
+
+    Large buffers hash SHA256 on a worker thread while BLAKE3 runs
+    multithreaded on the caller's; both release the GIL.
+
+    Args:
+        buf: Bytes to hash
+
+    Returns:
+        String in format "sha256hex:blake3hex"
+    """
+    if _blake3 is None:
+        sha = _sha256(buf).hexdigest()
+        return f"{sha}:{sha}"
+    if len(buf) < DUAL_HASH_PARALLEL_MIN_BYTES:
+        return f"{_sha256(buf).hexdigest()}:{_blake3(buf).hexdigest()}"
+
+    sha = _sha_pool().submit(lambda: _sha256(buf).hexdigest())
+    b3 = _blake3(buf, max_threads=_blake3.AUTO).hexdigest()
+    return f"{sha.result()}:{b3}"
 
 
 def merkle(items: list) -> str:
@@ -75,24 +136,156 @@ def merkle(items: list) -> str:
     if not items:
         return dual_hash(b"empty")
 
-    # Convert items to hashes
-    hashes = []
-    for item in items:
-        if isinstance(item, dict):
-            hashes.append(dual_hash(json.dumps(item, sort_keys=True)))
-        else:
-            hashes.append(dual_hash(str(item)))
-
-    # Build Merkle tree
-    while len(hashes) > 1:
-        if len(hashes) % 2:
-            hashes.append(hashes[-1])  # Duplicate last if odd
-        hashes = [
-            dual_hash(hashes[i] + hashes[i + 1])
-            for i in range(0, len(hashes), 2)
+    # Leaves and each tree level are hashed in one comprehension pass over
+    # bytes; the shared encoder matches json.dumps(item, sort_keys=True)
+    level = [_leaf_hash(item) for item in items]
+
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])  # Duplicate last if odd
+        pairs = iter(level)
+        level = [
+            dual_hash_bytes(left + right).encode('ascii')
+            for left, right in zip(pairs, pairs)
         ]
 
-    return hashes[0]
+    return level[0].decode('ascii')
+
+
+def _leaf_bytes(item) -> bytes:
+    """Merkle leaf input: a dict's sorted-key JSON or str(item), as UTF-8."""
+    text = _sorted_json(item) if isinstance(item, dict) else str(item)
+    return text.encode('utf-8')
+
+
+def _leaf_hash(item) -> bytes:
+    """Merkle leaf: dual hash of the item's leaf bytes."""
+    return dual_hash_bytes(_leaf_bytes(item)).encode('ascii')
+
+
+def _subtree_root(blobs: list) -> bytes:
+    """Root of a complete subtree over a power-of-two count of leaf bytes."""
+    level = [dual_hash_bytes(blob).encode('ascii') for blob in blobs]
+    while len(level) > 1:
+        pairs = iter(level)
+        level = [
+            dual_hash_bytes(left + right).encode('ascii')
+            for left, right in zip(pairs, pairs)
+        ]
+    return level[0]
+
+
+def merkle_parallel(items: list, workers: Optional[int] = None) -> str:
+    """
+    merkle() with complete subtrees hashed in a process pool.
+
+    Leaves are encoded once here and shipped to workers as bytes. The
+    batch is cut into aligned power-of-two shards (the remainder into
+    descending powers of two), so every shard root is an internal node
+    of the serial tree; the roots are folded with IncrementalMerkle.
+
+    Args:
+        items: List of items to compute root for
+        workers: Process count (default: os.cpu_count())
+
+    Returns:
+        Merkle root as dual-hash string, equal to merkle(items)
+    """
+    n = len(items)
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or n < 2:
+        return merkle(items)
+
+    blobs = [_leaf_bytes(item) for item in items]
+
+    bounds = []  # (start, height) of each aligned shard
+    height = max((n // workers).bit_length() - 1, 0)
+    start = 0
+    while start < n:
+        while start + (1 << height) > n:
+            height -= 1
+        bounds.append((start, height))
+        start += 1 << height
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as pool:
+        roots = pool.map(
+            _subtree_root,
+            [blobs[s:s + (1 << h)] for s, h in bounds],
+        )
+        acc = IncrementalMerkle()
+        for (_, h), root in zip(bounds, roots):
+            acc._push(root, h)
+    return acc.root()
+
+
+class IncrementalMerkle:
+    """
+    Append-only Merkle accumulator with the same root as merkle().
+
+    Keeps one peak per set bit of the leaf count (the roots of the
+    complete power-of-two subtrees), so append is amortized O(1) and
+    root() is O(log N) hashes instead of rehashing every leaf.
+    """
+
+    __slots__ = ("_peaks", "_count")
+
+    def __init__(self, items: Iterable = ()):
+        self._peaks = []  # _peaks[level] is a subtree root or None
+        self._count = 0
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, item) -> None:
+        """Add one leaf (a receipt dict or any str()-able item)."""
+        self._push(_leaf_hash(item), 0)
+
+    def _push(self, node: bytes, height: int) -> None:
+        """
+        Add the root of a complete subtree of 2**height leaves.
+
+        The leaf count must be a multiple of 2**height, so the subtree
+        sits where the serial tree would have built it.
+        """
+        size = 1 << height
+        level = height
+        while self._count >> level & 1:
+            node = dual_hash_bytes(self._peaks[level] + node).encode('ascii')
+            self._peaks[level] = None
+            level += 1
+        if level >= len(self._peaks):
+            self._peaks.extend([None] * (level - len(self._peaks) + 1))
+        self._peaks[level] = node
+        self._count += size
+
+    def extend(self, items: Iterable) -> None:
+        """Add leaves in order."""
+        for item in items:
+            self.append(item)
+
+    def root(self) -> str:
+        """
+        Merkle root of all leaves so far, equal to merkle(leaves).
+
+        Folds the peaks from the lowest level up. An unpaired node is
+        hashed with itself, as merkle() duplicates the last odd node.
+        """
+        if not self._count:
+            return dual_hash(b"empty")
+
+        node = None  # Rightmost node at the current level, below any peak
+        level = 0
+        while True:
+            full = self._count >> level
+            if full + (node is not None) == 1:
+                return (node or self._peaks[level]).decode('ascii')
+            if full & 1:
+                peak = self._peaks[level]
+                node = dual_hash_bytes(peak + (peak if node is None else node)).encode('ascii')
+            elif node is not None:
+                node = dual_hash_bytes(node + node).encode('ascii')
+            level += 1
 
 
 def validate_hash(hash_str: str) -> bool:
@@ -6,9 +6,10 @@ THIS IS A SIMULATION FOR ACADEMIC RESEARCH PURPOSES ONLY
 
 import csv
 import json
+import sys
 from datetime import datetime
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Optional
+from typing import Optional, TextIO
 
 from ..core import query_receipts, TENANT_ID, VERSION
 from ..contract import get_contract, get_contract_milestones
@@ -222,30 +223,45 @@ def format_currency(amount: float) -> str:
         return f"${amount:.2f}"
 
 
-def print_dashboard() -> None:
-    """Print dashboard summary to stdout."""
-    summary = generate_summary()
+def print_dashboard(out: Optional[TextIO] = None) -> None:
+    """
+    Print dashboard summary to stdout.
+
+    The report is assembled in memory and written with a single call so
+    line-buffered terminals flush once instead of per line.
 
-    print("\n" + "=" * 60)
-    print("SHIELDPROOF v2.1 - PUBLIC AUDIT DASHBOARD")
-    print("=" * 60)
-    print(f"Generated: {summary['generated_at']}")
-    print(f"Health Score: {summary['health_score']}%")
-    print("-" * 60)
-    print(f"Total Contracts:     {summary['total_contracts']}")
-    print(f"Total Committed:     {format_currency(summary['total_committed'])}")
-    print(f"Total Paid:          {format_currency(summary['total_paid'])}")
-    print(f"Total Verified:      {format_currency(summary['total_verified'])}")
-    print("-" * 60)
-    print(f"Contracts On Track:  {summary['contracts_on_track']}")
-    print(f"Contracts Overpaid:  {summary['contracts_overpaid']}")
-    print(f"Contracts Unverified:{summary['contracts_unverified']}")
-    print(f"Contracts Disputed:  {summary['contracts_disputed']}")
-    print("-" * 60)
-    print(f"Milestones Pending:  {summary['milestones_pending']}")
-    print(f"Milestones Disputed: {summary['milestones_disputed']}")
-    print(f"WASTE IDENTIFIED:    {format_currency(summary['waste_identified'])}")
-    print("=" * 60 + "\n")
+    Args:
+        out: Optional text stream to write to (default: sys.stdout)
+    """
+    summary = generate_summary()
+    rule = "-" * 60
+
+    lines = [
+        "",
+        "=" * 60,
+        "SHIELDPROOF v2.1 - PUBLIC AUDIT DASHBOARD",
+        "=" * 60,
+        f"Generated: {summary['generated_at']}",
+        f"Health Score: {summary['health_score']}%",
+        rule,
+        f"Total Contracts:     {summary['total_contracts']}",
+        f"Total Committed:     {format_currency(summary['total_committed'])}",
+        f"Total Paid:          {format_currency(summary['total_paid'])}",
+        f"Total Verified:      {format_currency(summary['total_verified'])}",
+        rule,
+        f"Contracts On Track:  {summary['contracts_on_track']}",
+        f"Contracts Overpaid:  {summary['contracts_overpaid']}",
+        f"Contracts Unverified:{summary['contracts_unverified']}",
+        f"Contracts Disputed:  {summary['contracts_disputed']}",
+        rule,
+        f"Milestones Pending:  {summary['milestones_pending']}",
+        f"Milestones Disputed: {summary['milestones_disputed']}",
+        f"WASTE IDENTIFIED:    {format_currency(summary['waste_identified'])}",
+        "=" * 60,
+        "",
+    ]
+
+    (out or sys.stdout).write("\n".join(lines) + "\n")
 
 
 class DashboardHandler(BaseHTTPRequestHandler):
@@ -0,0 +1,217 @@
+"""
+Tests for Gov-OS Real Data Gate (v6.1)
+
+Tests:
+- Sync and async cohort ingestion
+- Compression ratio calculation and memoization
+- Threshold calibration
+- Single-record and batch validation
+- Cohort config caching
+- Cohort filters
+
+THIS IS A SIMULATION FOR ACADEMIC RESEARCH PURPOSES ONLY
+"""
+
+import pytest
+
+from src.core.data_gate import RealDataGate, _compression_ratio
+
+
+def _records(n: int = 50) -> list:
+    """Synthetic award records with a mix of repetitive and varied text."""
+    return [
+        {
+            "award_id": f"AWD-{i:04d}",
+            "recipient_name": f"VENDOR-{i % 7}",
+            "description": ("maritime support services " * (8 + i % 5)) + f"lot {i * 7919}",
+            "amount": 10_000 + i * 137,
+        }
+        for i in range(n)
+    ]
+
+
+class TestIngest:
+
+    def test_ingest_async_matches_sync(self):
+        """Concurrent async ingestion should match sequential ingestion."""
+        import asyncio
+
+        def gate():
+            g = RealDataGate("unknown_cohort")
+            g.config.min_records = 1
+            return g
+
+        async def ingest_both():
+            return await asyncio.gather(
+                gate().ingest_cohort_async(), gate().ingest_cohort_async()
+            )
+
+        first, second = asyncio.run(ingest_both())
+        assert first == second == gate().ingest_cohort()
+
+
+class TestCompressionRatio:
+
+    def test_ratio_empty(self):
+        """Empty input should have ratio 1.0."""
+        assert _compression_ratio(b"") == 1.0
+
+    def test_ratio_repetitive_lower(self):
+        """Repetitive bytes should compress better than varied bytes."""
+        repetitive = b"abc" * 200
+        varied = bytes(range(256)) * 2
+        assert _compression_ratio(repetitive) < _compression_ratio(varied)
+
+    def test_canonical_json_is_stdlib_sorted_json(self):
+        """Hashed bytes should be sorted-key stdlib JSON, floats and NaN included."""
+        import json
+        from src.core.utils import canonical_json
+        record = {**_records(1)[0], "recipient_name": "Société", "x": 1e16, "y": float("nan")}
+        assert canonical_json(record) == json.dumps(record, sort_keys=True).encode("utf-8")
+
+    def test_ratio_matches_record_path(self):
+        """Record ratio should equal ratio of its canonical bytes."""
+        gate = RealDataGate("unknown_cohort")
+        record = _records(1)[0]
+        first = gate._calculate_compression_ratio(record)
+        second = gate._calculate_compression_ratio(dict(reversed(record.items())))
+        assert first == second
+
+
+class TestCalibrateThreshold:
+
+    def test_calibrate_sets_threshold(self):
+        """calibrate_threshold should store and return the p90 ratio."""
+        gate = RealDataGate("unknown_cohort")
+        threshold = gate.calibrate_threshold(_records())
+        assert 0.10 <= threshold <= 0.95
+        assert gate.calibrated_threshold == threshold
+
+    def test_calibrate_parallel_matches_serial(self, monkeypatch):
+        """Thread-pool ratio path should calibrate to the same threshold."""
+        import src.core.data_gate as data_gate
+        records = _records(200)
+        serial = RealDataGate("unknown_cohort").calibrate_threshold(records)
+        monkeypatch.setattr(data_gate, "PARALLEL_RATIO_MIN_RECORDS", 1)
+        parallel = RealDataGate("unknown_cohort").calibrate_threshold(records)
+        assert parallel == serial
+
+    def test_calibrate_reuses_ingested_bytes(self):
+        """Ingested records should calibrate from their cached encoding."""
+        from src.core.utils import canonical_json
+        gate = RealDataGate("unknown_cohort")
+        gate.config.min_records = 1
+        records = gate.ingest_cohort()
+        assert gate._serialize(records[0]) is gate._record_bytes[id(records[0])]
+        assert gate._serialize(records[0]) == canonical_json(records[0])
+        threshold = gate.calibrate_threshold()
+        fresh = RealDataGate("unknown_cohort").calibrate_threshold(
+            [dict(r) for r in records]
+        )
+        assert threshold == fresh
+
+    def test_calibrate_without_numpy_uses_p90_rank(self, monkeypatch):
+        """Fallback percentile should pick the p90 element of the ratios."""
+        import src.core.data_gate as data_gate
+        monkeypatch.setattr(data_gate, "HAS_NUMPY", False)
+        gate = RealDataGate("unknown_cohort")
+        records = _records()
+        ratios = sorted(gate._calculate_compression_ratio(r) for r in records)
+        assert gate.calibrate_threshold(records) == ratios[int(len(ratios) * 0.90)]
+
+    def test_calibrate_numpy_matches_fallback(self, monkeypatch):
+        """numpy and stdlib percentile paths should pick the same ratio."""
+        import src.core.data_gate as data_gate
+        records = _records(37)
+        with_numpy = RealDataGate("unknown_cohort").calibrate_threshold(records)
+        monkeypatch.setattr(data_gate, "HAS_NUMPY", False)
+        assert RealDataGate("unknown_cohort").calibrate_threshold(records) == with_numpy
+
+    def test_calibrate_uses_zlib_scale(self):
+        """Calibration should measure zlib ratios whatever is installed."""
+        from src.core.utils import canonical_json
+        records = _records(40)
+        ratios = sorted(_compression_ratio(canonical_json(r)) for r in records)
+        threshold = RealDataGate("unknown_cohort").calibrate_threshold(records)
+        assert threshold == ratios[int(len(ratios) * 0.90)]
+
+    def test_calibrate_counts_duplicates(self):
+        """Duplicate records should weight the percentile by multiplicity."""
+        gate = RealDataGate("unknown_cohort")
+        records = _records(20)
+        heavy = records[:1] * 200 + records
+        threshold = gate.calibrate_threshold(heavy)
+        assert threshold == gate._calculate_compression_ratio(records[0])
+        assert len(gate._calibrated_ratios) == 20
+
+    def test_calibrate_empty_returns_default(self):
+        """No records should fall back to the default threshold."""
+        from src.core.constants import COMPRESSION_THRESHOLD_DEFAULT
+        gate = RealDataGate("unknown_cohort")
+        assert gate.calibrate_threshold([]) == COMPRESSION_THRESHOLD_DEFAULT
+
+
+class TestValidateGate:
+
+    def test_validate_against_calibration(self):
+        """validate_gate should compare the record ratio to the threshold."""
+        gate = RealDataGate("unknown_cohort")
+        records = _records()
+        threshold = gate.calibrate_threshold(records)
+        result = gate.validate_gate(records[0])
+        assert result["record_id"] == "AWD-0000"
+        assert result["threshold_used"] == round(threshold, 4)
+        assert result["passed"] == (
+            gate._calculate_compression_ratio(records[0]) >= threshold
+        )
+
+
+class TestCohortConfig:
+
+    def test_config_parsed_once(self):
+        """Repeat loads should reuse the cached parse of an unchanged file."""
+        from src.core.data_gate import _load_cohort_config
+        assert _load_cohort_config() is _load_cohort_config()
+
+
+class TestApplyFilters:
+
+    def test_filters_keep_matching_and_missing_keys(self):
+        """Records are dropped only when a present key mismatches."""
+        gate = RealDataGate("unknown_cohort")
+        records = [{"agency": "HHS"}, {"agency": "DOD"}, {"amount": 1}]
+        assert gate._apply_filters(records, {"agency": "HHS"}) == [
+            {"agency": "HHS"}, {"amount": 1},
+        ]
+
+    def test_filters_unhashable_values(self):
+        """Filter values need not be hashable."""
+        gate = RealDataGate("unknown_cohort")
+        records = [{"tags": ["a"]}, {"tags": ["b"]}]
+        assert gate._apply_filters(records, {"tags": ["a"]}) == [{"tags": ["a"]}]
+
+    def test_filters_fall_back_to_all_records(self):
+        """No matches should return the unfiltered records."""
+        gate = RealDataGate("unknown_cohort")
+        records = [{"agency": "DOD"}]
+        assert gate._apply_filters(records, {"agency": "HHS"}) == records
+
+    def test_validate_reuses_calibrated_ratio(self, monkeypatch):
+        """Calibrated records should validate without recompressing."""
+        gate = RealDataGate("unknown_cohort")
+        records = _records()
+        gate.calibrate_threshold(records)
+        expected = gate.validate_gate(records[3])
+
+        def fail(data):
+            raise AssertionError("recompressed a calibrated record")
+        monkeypatch.setattr(gate, "_ratio_bytes", fail)
+        assert gate.validate_gate(records[3]) == expected
+
+    def test_validate_batch_matches_single(self):
+        """validate_gate_batch should agree with per-record validate_gate."""
+        gate = RealDataGate("unknown_cohort")
+        records = _records()
+        gate.calibrate_threshold(records)
+        batch = gate.validate_gate_batch(records[:10])
+        assert batch == [gate.validate_gate(r) for r in records[:10]]
@@ -0,0 +1,307 @@
+"""
+Tests for Gov-OS ForeignAid ETL (v6.2)
+
+Tests:
+- Dataclass serialization
+- Simulated award and partner generation
+- Column-oriented partner frames
+- Round-trip funding detection
+- Memoized payload hashing
+
+THIS IS A SIMULATION FOR ACADEMIC RESEARCH PURPOSES ONLY
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.core.foreignaid_etl import (
+    ForeignAidAward,
+    ForeignAidETL,
+    ImplementingPartner,
+    ImplementingPartnerFrame,
+    RoundTripEvidence,
+)
+from src.core.receipt import emit_receipt
+
+
+def _partner(**overrides) -> ImplementingPartner:
+    fields = dict(
+        partner_id="IP-0001",
+        name="Democracy International",
+        ein="52-1234567",
+        duns="123456789",
+        total_awards=1_000_000.0,
+        award_count=12,
+        agencies=["USAID"],
+        political_donations=150_000.0,
+    )
+    fields.update(overrides)
+    return ImplementingPartner(**fields)
+
+
+class TestToDict:
+
+    def test_award_to_dict_iso_date(self):
+        """ForeignAidAward.to_dict should render the date as ISO text."""
+        award = ForeignAidAward(
+            award_id="FA-USAID-000001",
+            agency="USAID",
+            recipient_name="CARE International",
+            recipient_ein=None,
+            recipient_country="USA",
+            amount=250_000.0,
+            fiscal_year=2024,
+            sector="health",
+            description="Program",
+            date=datetime(2024, 3, 1),
+        )
+        d = award.to_dict()
+        assert d["date"] == "2024-03-01T00:00:00"
+        assert d["award_id"] == "FA-USAID-000001"
+        assert award.to_dict() == d
+        assert "_iso_date" not in d
+
+    def test_partner_to_dict_has_all_fields(self):
+        """ImplementingPartner.to_dict should include every field."""
+        d = _partner().to_dict()
+        assert d["name"] == "Democracy International"
+        assert d["agencies"] == ["USAID"]
+        assert d["form_990_revenue"] is None
+        assert len(d) == 13
+
+    def test_dataclasses_use_slots(self):
+        """Slotted dataclasses should reject unknown attributes."""
+        with pytest.raises(AttributeError):
+            _partner().unknown = 1
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "stdlib"])
+def rng_backend(request, monkeypatch):
+    """Run a test against both the numpy and stdlib random generators."""
+    import src.core.foreignaid_etl as foreignaid_etl
+    if request.param and not foreignaid_etl.HAS_NUMPY:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(foreignaid_etl, "HAS_NUMPY", request.param)
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    """Receipts emitted by the ETL, in order."""
+    import src.core.foreignaid_etl as foreignaid_etl
+    receipts = []
+
+    def record(*args, **kwargs):
+        receipts.append(emit_receipt(*args, **kwargs))
+        return receipts[-1]
+
+    monkeypatch.setattr(foreignaid_etl, "emit_receipt", record)
+    return receipts
+
+
+class TestSimulatedData:
+
+    def test_awards_shape_and_ranges(self, rng_backend):
+        """Simulated awards should be deterministic and within bounds."""
+        etl = ForeignAidETL()
+        awards = etl._generate_simulated_awards({"agency": "STATE"}, n=50)
+        assert awards == etl._generate_simulated_awards({"agency": "STATE"}, n=50)
+        assert len(awards) == 50
+        assert awards[7]["award_id"] == "FA-STATE-000007"
+        for award in awards:
+            assert 100_000 <= award["amount"] <= 50_000_000
+            assert type(award["amount"]) is int
+            assert award["fiscal_year"] in (2022, 2023, 2024)
+
+    def test_cross_reference_stable_and_isolated(self):
+        """Keyed simulations should be repeatable and not touch global random."""
+        import random
+        etl = ForeignAidETL()
+        random.seed(7)
+        expected_next = random.random()
+        random.seed(7)
+        fec = etl._generate_simulated_fec("Freedom House")
+        f990 = etl._generate_simulated_990("13-4567890")
+        assert random.random() == expected_next
+        assert fec == etl._generate_simulated_fec("Freedom House")
+        assert f990 == etl._generate_simulated_990("13-4567890")
+        assert 500_000 <= fec["total_donations"] <= 2_000_000
+
+    def test_partners_democracy_orgs_donate_more(self, rng_backend):
+        """The first three partners should carry the larger donations."""
+        partners = ForeignAidETL()._generate_simulated_partners("USAID")
+        assert len(partners) == 10
+        assert all(p.political_donations >= 100_000 for p in partners[:3])
+        assert all(p.political_donations <= 50_000 for p in partners[3:])
+        assert all(3 <= len(p.officers) <= 8 for p in partners)
+
+    def test_instance_seed(self, rng_backend):
+        """Simulated draws should follow the per-instance seed."""
+        default = ForeignAidETL().fetch_awards({"agency": "USAID"})
+        assert ForeignAidETL(seed=42).fetch_awards({"agency": "USAID"}) == default
+        other = ForeignAidETL(seed=7)
+        assert other.fetch_awards({"agency": "USAID"}) != default
+        assert other.fetch_awards({"agency": "USAID"}) == other.fetch_awards({"agency": "USAID"})
+
+    def test_awards_stream_chunks(self, rng_backend, monkeypatch):
+        """Streamed awards should be deterministic and numbered across chunks."""
+        import itertools
+        import src.core.foreignaid_etl as foreignaid_etl
+        monkeypatch.setattr(foreignaid_etl, "AWARD_STREAM_CHUNK", 16)
+        etl = ForeignAidETL()
+        awards = list(etl.fetch_awards_stream({"agency": "MCC"}, n=40))
+        assert [a["award_id"] for a in awards] == [f"FA-MCC-{i:06d}" for i in range(40)]
+        assert awards == list(etl.fetch_awards_stream({"agency": "MCC"}, n=40))
+        assert all(100_000 <= a["amount"] <= 50_000_000 for a in awards)
+        head = list(itertools.islice(etl.fetch_awards_stream({"agency": "MCC"}, n=40), 5))
+        assert head == awards[:5]
+
+    def test_awards_stream_receipt_on_early_stop(self, emitted):
+        """A stream closed early should still emit its ingest receipt."""
+        import itertools
+        stream = ForeignAidETL().fetch_awards_stream({"agency": "MCC"}, n=40)
+        assert len(list(itertools.islice(stream, 5))) == 5
+        stream.close()
+        assert [r["record_count"] for r in emitted] == [5]
+
+    def test_awards_since_watermark(self, rng_backend):
+        """Watermarked fetches should return only later awards."""
+        etl = ForeignAidETL()
+        full = etl.fetch_awards({"agency": "STATE"})
+        newer = etl.fetch_awards({"agency": "STATE"}, since_award_id="FA-STATE-000089")
+        assert newer == full[90:]
+        recent = etl.fetch_awards({"agency": "STATE"}, since_fiscal_year=2024)
+        assert recent == [a for a in full if a["fiscal_year"] >= 2024]
+
+    def test_awards_incremental_resumes(self, emitted):
+        """incremental=True should resume from the stored watermark."""
+        etl = ForeignAidETL()
+        first = etl.fetch_awards({"agency": "MCC"}, incremental=True)
+        assert len(first) == 100
+        assert etl.fetch_awards({"agency": "MCC"}, incremental=True) == []
+        receipts = emitted
+        assert [r["receipt_type"] for r in receipts] == ["foreignaid_ingest_incremental"] * 2
+        assert receipts[1]["since_award_id"] == "FA-MCC-000099"
+        assert receipts[1]["high_watermark"] == "FA-MCC-000099"
+
+    def test_awards_arrow_matches_dict_rows(self):
+        """Arrow batches should hold the same rows as fetch_awards."""
+        pytest.importorskip("numpy")
+        pytest.importorskip("pyarrow")
+        etl = ForeignAidETL()
+        filters = {"agency": "STATE", "sector": ""}
+        batch = etl.fetch_awards_arrow(filters, n=100)
+        assert batch.to_pylist() == etl.fetch_awards(filters)
+
+    def test_awards_arrow_requires_pyarrow(self, monkeypatch):
+        """fetch_awards_arrow should raise ImportError without pyarrow."""
+        import src.core.foreignaid_etl as foreignaid_etl
+        monkeypatch.setattr(foreignaid_etl, "HAS_PYARROW", False)
+        with pytest.raises(ImportError):
+            ForeignAidETL().fetch_awards_arrow({}, n=10)
+
+
+class TestPartnerFrame:
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_frame_rows_match_partner_list(self):
+        """Frame rows should equal the list-based simulated partners."""
+        etl = ForeignAidETL()
+        frame = etl.fetch_implementing_partners_frame("USAID")
+        partners = etl.fetch_implementing_partners("USAID")
+        assert len(frame) == len(partners)
+        assert [frame.iloc(i) for i in range(len(frame))] == partners
+
+    def test_frame_packed_dtypes_and_rows(self):
+        """Simulated frames should use packed integer columns."""
+        import numpy as np
+        etl = ForeignAidETL()
+        frame = etl.fetch_implementing_partners_frame("USAID")
+        assert frame.total_awards.dtype == np.int64
+        assert frame.political_donations.dtype == np.int64
+        assert frame.award_count.dtype == np.int32
+        partners = etl.fetch_implementing_partners("USAID")
+        assert frame.to_dict_rows() == [p.to_dict() for p in partners]
+
+    def test_frame_from_partners_roundtrip(self):
+        """from_partners should preserve rows, including None fields."""
+        partners = [_partner(), _partner(partner_id="IP-0002", total_awards=0.0)]
+        frame = ImplementingPartnerFrame.from_partners(partners)
+        assert frame.form_990_revenue.dtype == object
+        assert [frame.iloc(i) for i in range(2)] == partners
+
+    def test_frame_from_partners_dollar_dtypes(self):
+        """Whole-dollar columns should match simulated frames; cents widen."""
+        import numpy as np
+        frame = ImplementingPartnerFrame.from_partners([_partner()])
+        assert frame.total_awards.dtype == np.int64
+        assert frame.political_donations.dtype == np.int64
+        frame = ImplementingPartnerFrame.from_partners([_partner(total_awards=10.5)])
+        assert frame.total_awards.dtype == np.float64
+        assert frame.political_donations.dtype == np.int64
+
+    def test_batch_detection_accepts_frame(self, monkeypatch):
+        """detect_round_trip_batch should score a frame like its rows, from columns."""
+        etl = ForeignAidETL()
+        frame = etl.fetch_implementing_partners_frame("USAID")
+        rows = [frame.iloc(i) for i in range(len(frame))]
+        expected = etl.detect_round_trip_batch(rows)
+        monkeypatch.setattr(ImplementingPartnerFrame, "iloc", None)
+        assert etl.detect_round_trip_batch(frame) == expected
+
+
+class TestDetectRoundTrip:
+
+    def test_detect_round_trip_flags_ratio(self):
+        """Partners above the donation/award threshold should be flagged."""
+        evidence = ForeignAidETL().detect_round_trip(_partner())
+        assert isinstance(evidence, RoundTripEvidence)
+        assert evidence.score == 0.15
+        assert evidence.flagged
+        assert evidence.to_dict()["details"]["threshold"] == 0.10
+
+    def test_detect_round_trip_batch_matches_scalar(self, rng_backend):
+        """Batch detection should agree with per-partner detection."""
+        etl = ForeignAidETL()
+        partners = etl._generate_simulated_partners("USAID") + [_partner(total_awards=0.0)]
+        batch = etl.detect_round_trip_batch(partners, threshold=0.002)
+        assert batch == [etl.detect_round_trip(p, threshold=0.002) for p in partners]
+        assert any(e.flagged for e in batch) and not all(e.flagged for e in batch)
+        assert etl.detect_round_trip_batch([]) == []
+
+    def test_detect_round_trip_zero_awards(self):
+        """Zero awards should score 0 and not flag."""
+        evidence = ForeignAidETL().detect_round_trip(_partner(total_awards=0.0))
+        assert evidence.score == 0.0
+        assert not evidence.flagged
+
+
+class TestPayloadHash:
+
+    @pytest.mark.parametrize("payload", [
+        {"agency": "USAID", "count": 1},
+        {"agency": "USAID", "count": True},
+        {"agency": "USAID", "count": 1.0},
+        {"filters": {"sector": "health"}},
+        {"filters": [["sector", "health"]]},
+        {"filters": {"tags": {"b", "a"}}},
+    ])
+    def test_payload_hash_matches_uncached(self, payload):
+        """Memoized hashes should equal hashing the canonical JSON directly."""
+        from src.core.foreignaid_etl import _payload_hash
+        from src.core.utils import canonical_json, dual_hash
+        expected = dual_hash(canonical_json(payload, default=str))
+        assert _payload_hash(payload) == expected
+        assert _payload_hash(payload) == expected
+
+    def test_payload_hash_is_stdlib_json(self):
+        """Payload hashes should hash sorted-key stdlib JSON."""
+        import json
+        from src.core.foreignaid_etl import _payload_hash
+        from src.core.utils import dual_hash
+        payload = {"query": "Société", "filters": {"b": 2, "a": [1, None]}, "n": 1e16}
+        assert _payload_hash(payload) == dual_hash(json.dumps(payload, sort_keys=True))
+
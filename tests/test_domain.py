@@ -0,0 +1,98 @@
+"""
+Tests for Gov-OS Domain Loader
+
+Tests:
+- Domain config loading and YAML parse caching
+- Domain discovery
+- Registry updates under concurrency
+
+THIS IS A SIMULATION FOR ACADEMIC RESEARCH PURPOSES ONLY
+"""
+
+import pytest
+
+from src.domain import (
+    DomainConfig,
+    load_domain,
+    reset_registry,
+    _parse_yaml_cached,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Reset the domain registry before and after each test."""
+    reset_registry()
+    yield
+    reset_registry()
+
+
+class TestLoadDomain:
+
+    def test_load_domain_returns_config(self):
+        """Shipped domains should load a DomainConfig."""
+        config = load_domain("defense")
+        assert isinstance(config, DomainConfig)
+        assert config.name == "defense"
+        assert config.tenant_id == "gov-os-defense"
+
+    def test_parse_yaml_cached(self):
+        """YAML parses should be cached per path and mtime."""
+        import os
+        import src.domain as domain
+        path = os.path.join(
+            os.path.dirname(domain.__file__), "domains", "defense", "config.yaml"
+        )
+        mtime_ns = os.stat(path).st_mtime_ns
+        data = _parse_yaml_cached(path, mtime_ns)
+        assert "defense_ingest_receipt" in data["receipts"]
+        assert _parse_yaml_cached(path, mtime_ns) is data
+
+    def test_load_domain_unknown_default(self):
+        """Unknown domains should fall back to a default config."""
+        config = load_domain("no_such_domain")
+        assert config.tenant_id == "gov-os-no_such_domain"
+
+    def test_yaml_parse_cached_across_reloads(self):
+        """Reloading after a registry reset should reuse the parsed YAML."""
+        load_domain("medicaid")
+        hits = _parse_yaml_cached.cache_info().hits
+        reset_registry()
+        load_domain("medicaid")
+        assert _parse_yaml_cached.cache_info().hits == hits + 1
+
+
+class TestListDomains:
+
+    def test_list_domains_finds_shipped(self):
+        """Domain directories with a config.yaml should be listed."""
+        from src.domain import list_domains
+        domains = list_domains()
+        assert {"defense", "medicaid"} <= set(domains)
+        assert domains == sorted(domains)
+
+    def test_list_domains_includes_registered(self):
+        """Registered domains should be listed without a directory."""
+        from src.domain import list_domains, register_domain
+        register_domain("custom", DomainConfig(name="custom"))
+        assert "custom" in list_domains()
+
+
+class TestRegistry:
+
+    def test_concurrent_loads_share_config(self):
+        """Racing loads of one domain should all get the same object."""
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            configs = list(pool.map(load_domain, ["medicaid"] * 32))
+        assert all(c is configs[0] for c in configs)
+
+    def test_register_and_unregister(self):
+        """Registry writes should replace the snapshot, not mutate it."""
+        import src.domain as domain
+        before = domain._DOMAIN_REGISTRY
+        domain.register_domain("custom", DomainConfig(name="custom"))
+        assert "custom" not in before
+        assert load_domain("custom").name == "custom"
+        domain.unregister_domain("custom")
+        assert "custom" not in domain._DOMAIN_REGISTRY
@@ -44,6 +44,16 @@ class TestSuperGraphBuild:
         assert "defense" in G.graph["domains"]
         assert "medicaid" in G.graph["domains"]
 
+    def test_super_graph_domain_nodes(self):
+        """domain_nodes should hold each domain graph's node set."""
+        from src.scenarios.contagion import build_super_graph, MEDICAID_RING_SET
+
+        G = build_super_graph()
+
+        for name, graph in G.graph["domains"].items():
+            assert G.graph["domain_nodes"][name] == frozenset(graph)
+        assert MEDICAID_RING_SET <= G.graph["domain_nodes"]["medicaid"]
+
     def test_super_graph_shared_entities(self):
         """Super-graph should identify shared entities."""
         from src.scenarios.contagion import build_super_graph, SHELL_ENTITY_ID
@@ -54,6 +64,19 @@ class TestSuperGraphBuild:
         shared = G.graph.get("shared_entities", [])
         assert SHELL_ENTITY_ID in shared
 
+    def test_raf_merge_accepts_str_edge_domains(self):
+        """raf.build_super_graph should merge an input edge's str domains."""
+        from src.raf import build_super_graph
+
+        defense = nx.DiGraph()
+        defense.add_edge("A", "B", weight=1, domains="defense")
+        medicaid = nx.DiGraph()
+        medicaid.add_edge("A", "B", weight=2)
+
+        G = build_super_graph({"defense": defense, "medicaid": medicaid})
+        assert G["A"]["B"]["domains"] == ["defense", "medicaid"]
+        assert G["A"]["B"]["weight"] == 3
+
 
 @pytest.mark.skipif(not HAS_NETWORKX, reason="NetworkX required")
 class TestSharedEntityDetection:
@@ -246,3 +269,157 @@ class TestSampleDataGenerators:
         # Shell should be in both
         assert "SHARED_SHELL" in defense_entities
         assert "SHARED_SHELL" in medicaid_entities
+
+
+class TestScenarioSamplers:
+    """Tests for the contagion scenario sample generators."""
+
+    def test_samplers_deterministic_with_rings(self):
+        """Samplers should be seeded, sized and include the fraud rows."""
+        import random
+        import src.scenarios.contagion as backend
+        state = random.getstate()
+        defense = backend.sample_defense_transactions(n=60, seed=1)
+        assert random.getstate() == state  # global random untouched
+        assert defense == backend.sample_defense_transactions(n=60, seed=1)
+        assert len(defense) == 54  # n - 10 normal + 3 ring + 1 shell link
+        assert sum(1 for tx in defense if tx.get("_is_fraud")) == 4
+        assert all(0 <= tx["amount_usd"] <= 1_000_000 for tx in defense)
+
+        aid = backend.sample_aid_transactions(n=20, seed=2)
+        assert len(aid) == 18
+        assert all(tx["source_duns"] == "USAID" for tx in aid[:15])
+        medicaid = backend.sample_medicaid_transactions(n=30, seed=3)
+        assert {tx["domain"] for tx in medicaid} == {"medicaid"}
+
+    def test_samplers_independent_of_numpy(self, monkeypatch):
+        """A seed should give the same sample data with or without numpy."""
+        import src.scenarios.contagion as contagion
+        with_numpy = contagion.sample_defense_transactions(n=40, seed=9)
+        monkeypatch.setattr(contagion, "HAS_NUMPY", not contagion.HAS_NUMPY)
+        assert contagion.sample_defense_transactions(n=40, seed=9) == with_numpy
+
+
+@pytest.mark.skipif(not HAS_NETWORKX, reason="NetworkX required")
+class TestColumnarTransactions:
+    """Tests for the columnar sample transactions."""
+
+    @pytest.mark.parametrize("domain", ["defense", "medicaid", "aid"])
+    def test_columnar_matches_records_and_graph(self, domain):
+        """Columnar samples should hold the same rows and build the same graph."""
+        pytest.importorskip("numpy")
+        import src.scenarios.contagion as contagion
+
+        records = getattr(contagion, f"sample_{domain}_transactions")(n=40, seed=5)
+        columns = getattr(contagion, f"sample_{domain}_transactions_columnar")(n=40, seed=5)
+        assert len(columns) == len(records)
+        assert columns.date.dtype == "datetime64[us]"
+        assert columns.to_records() == records
+
+        G_rows = contagion.build_domain_graph(records, domain)
+        G_cols = contagion.build_domain_graph(columns, domain)
+        assert list(G_cols.nodes(data=True)) == list(G_rows.nodes(data=True))
+        assert list(G_cols.edges(data=True)) == list(G_rows.edges(data=True))
+
+    def test_domain_graph_shares_transaction_aggregation(self):
+        """Unkeyed rows should aggregate as in raf.build_transaction_graph."""
+        from src.raf import build_transaction_graph
+        from src.scenarios.contagion import build_domain_graph
+
+        records = [
+            {"vendor": "A", "recipient": "B", "amount_usd": 5, "date": datetime(2024, 1, 1)},
+            {"vendor": "A", "recipient": "B", "amount_usd": 7, "date": datetime(2024, 3, 1)},
+            {"from": "B", "to": "C", "amount_usd": 2, "date": "2023-06-01"},
+        ]
+        G_raf = build_transaction_graph(records)
+        G_dom = build_domain_graph(records, "defense")
+        for u, v, attrs in G_raf.edges(data=True):
+            assert G_dom[u][v] == {**attrs, "domain": "defense"}
+
+
+class TestCrossDomainLinks:
+    """Tests for the cross-domain adjacency mask."""
+
+    def test_links_match_table(self):
+        """_links should agree with AID_CROSS_DOMAIN_LINKS for every pair."""
+        from src.scenarios.contagion import (
+            AID_CROSS_DOMAIN_LINKS, SUPPORTED_DOMAINS, _links,
+        )
+
+        for src in SUPPORTED_DOMAINS:
+            for dst in SUPPORTED_DOMAINS:
+                expected = dst in AID_CROSS_DOMAIN_LINKS.get(src, ())
+                assert _links(src, dst) == expected
+        assert not _links("aid", "unknown")
+
+
+@pytest.mark.skipif(not HAS_NETWORKX, reason="NetworkX required")
+class TestCycleReuse:
+    """Tests for reuse of the super-graph's cycle list."""
+
+    def test_collapse_reuses_super_graph_cycles(self, monkeypatch):
+        """simulate_medicaid_collapse should not re-enumerate cycles."""
+        import src.scenarios.contagion as contagion
+
+        G = contagion.build_super_graph()
+        expected = contagion.simulate_medicaid_collapse(G)
+
+        def fail(graph):
+            raise AssertionError("cycles recomputed")
+        monkeypatch.setattr(contagion, "detect_cycles", fail)
+        assert contagion.simulate_medicaid_collapse(G) == expected
+
+
+@pytest.mark.skipif(not HAS_NETWORKX, reason="NetworkX required")
+class TestSuperGraphCache:
+    """Tests for the pickled sample super-graph."""
+
+    def test_cached_graph_matches_build(self, tmp_path, monkeypatch):
+        """A cache hit should return the built graph without rebuilding."""
+        import src.scenarios.contagion as contagion
+
+        first = contagion.load_sample_super_graph(tmp_path)
+        assert len(list(tmp_path.glob("super_graph_*.pkl"))) == 1
+
+        def fail():
+            raise AssertionError("super-graph rebuilt")
+        monkeypatch.setattr(contagion, "build_super_graph", fail)
+        second = contagion.load_sample_super_graph(tmp_path)
+        assert dict(second.nodes(data=True)) == dict(first.nodes(data=True))
+        assert list(second.edges(data=True)) == list(first.edges(data=True))
+        assert second.graph["cycles"] == first.graph["cycles"]
+
+    def test_no_cache_dir_skips_pickle(self, monkeypatch):
+        """Without cache_dir the graph should be built, never unpickled."""
+        import src.scenarios.contagion as contagion
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pickle used")
+        monkeypatch.setattr(contagion.pickle, "load", fail)
+        monkeypatch.setattr(contagion.pickle, "dump", fail)
+        assert contagion.load_sample_super_graph().number_of_nodes() > 0
+        assert contagion.run_contagion_test()
+
+    def test_key_follows_inputs(self, tmp_path, monkeypatch):
+        """Different sample transactions should not reuse a cached graph."""
+        import src.scenarios.contagion as contagion
+
+        contagion.load_sample_super_graph(tmp_path)
+        aid = contagion.sample_aid_transactions(n=20)
+        monkeypatch.setattr(contagion, "sample_aid_transactions", lambda: aid)
+        G = contagion.load_sample_super_graph(tmp_path)
+        assert len(list(tmp_path.glob("super_graph_*.pkl"))) == 2
+        assert G.number_of_nodes() == contagion.build_super_graph(
+            aid_transactions=aid
+        ).number_of_nodes()
+
+    def test_unloadable_pickle_rebuilds(self, tmp_path):
+        """A pickle that fails to load for any reason should be rebuilt."""
+        import src.scenarios.contagion as contagion
+
+        contagion.load_sample_super_graph(tmp_path)
+        (path,) = tmp_path.glob("super_graph_*.pkl")
+        # Unpickling this raises AttributeError, as a stale class path would
+        path.write_bytes(b"\x80\x04cbuiltins\nno_such_attr\n.")
+        G = contagion.load_sample_super_graph(tmp_path)
+        assert G.number_of_nodes() > 0
@@ -75,6 +75,20 @@ class TestRegisterContract:
         assert "terms_hash" in r
         assert ":" in r["terms_hash"]
 
+    def test_register_contract_terms_hash_cached(self):
+        """Repeated terms should reuse the hash of their sorted JSON."""
+        import json
+        from src.shieldproof.core import dual_hash
+        from src.shieldproof.contract.register import _terms_hash
+        terms = {"payment_terms": "net30", "warranty": "1y"}
+        expected = dual_hash(json.dumps(terms, sort_keys=True))
+        kwargs = dict(contractor="Corp", amount=1.0,
+                      milestones=[{"id": "M1", "amount": 1.0}])
+        assert register_contract(terms=terms, **kwargs)["terms_hash"] == expected
+        hits = _terms_hash.cache_info().hits
+        assert register_contract(terms=dict(terms), **kwargs)["terms_hash"] == expected
+        assert _terms_hash.cache_info().hits == hits + 1
+
     def test_register_contract_milestone_normalization(self):
         """register_contract should normalize milestones with PENDING status."""
         r = register_contract(
@@ -113,6 +127,22 @@ class TestContractStoprules:
             )
         assert "Duplicate contract" in str(exc_info.value)
 
+    def test_duplicate_check_resets_with_ledger(self):
+        """A cleared ledger should forget previously registered ids."""
+        kwargs = dict(
+            contractor="Corp",
+            amount=100.00,
+            milestones=[{"id": "M1", "amount": 100.00}],
+            terms={},
+            contract_id="REUSED-ID",
+        )
+        register_contract(**kwargs)
+        with pytest.raises(StopRule):
+            register_contract(**kwargs)
+
+        clear_ledger()
+        assert register_contract(**kwargs)["contract_id"] == "REUSED-ID"
+
     def test_stoprule_invalid_amount_negative(self):
         """register_contract should reject negative amount."""
         with pytest.raises(StopRule) as exc_info:
@@ -150,6 +180,25 @@ class TestContractStoprules:
         assert "Milestone sum" in str(exc_info.value)
 
 
+    def test_milestone_cents_sum_exactly(self):
+        """Float milestone amounts should match the total in exact cents."""
+        receipt = register_contract(
+            contractor="Test Corp",
+            amount=0.3,
+            milestones=[{"id": "M1", "amount": 0.1}, {"id": "M2", "amount": 0.2}],
+            terms={},
+        )
+        assert receipt["amount_cents"] == 30
+
+        with pytest.raises(StopRule):
+            register_contract(
+                contractor="Test Corp",
+                amount=100.00,
+                milestones=[{"id": "M1", "amount": 33.33}] * 3,
+                terms={},
+            )
+
+
 class TestGetContract:
     """Tests for get_contract function."""
 
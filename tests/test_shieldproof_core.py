@@ -64,6 +64,26 @@ class TestDualHash:
         h = dual_hash("")
         assert ":" in h
 
+    def test_dual_hash_bytes_matches(self):
+        """dual_hash_bytes should equal dual_hash of the decoded string."""
+        from src.shieldproof.core import dual_hash_bytes
+        assert dual_hash_bytes("héllo".encode("utf-8")) == dual_hash("héllo")
+
+    def test_dual_hash_str_subclass(self):
+        """str subclasses should hash like the plain string."""
+        class Label(str):
+            pass
+        assert dual_hash(Label("abc")) == dual_hash("abc")
+
+    def test_dual_hash_parallel_matches_serial(self, monkeypatch):
+        """Concurrent hashing of large inputs should not change the digest."""
+        pytest.importorskip("blake3")
+        import src.shieldproof.core.utils as utils
+        buf = bytes(range(256)) * 64
+        serial = utils.dual_hash_bytes(buf)
+        monkeypatch.setattr(utils, "DUAL_HASH_PARALLEL_MIN_BYTES", 1)
+        assert utils.dual_hash_bytes(buf) == serial
+
 
 class TestEmitReceipt:
     """Tests for emit_receipt function."""
@@ -91,6 +111,12 @@ class TestEmitReceipt:
         r = emit_receipt("test", {"data": "test"}, to_stdout=False)
         assert ":" in r["payload_hash"]
 
+    def test_emit_receipt_payload_hash_input(self):
+        """payload_hash should hash the sorted-key json.dumps of the data."""
+        data = {"b": [1, 2], "a": "Société"}
+        r = emit_receipt("test", data, to_stdout=False, to_ledger=False)
+        assert r["payload_hash"] == dual_hash(json.dumps(data, sort_keys=True))
+
     def test_emit_receipt_data_included(self):
         """emit_receipt should include data fields."""
         r = emit_receipt("test", {"custom_field": "custom_value"}, to_stdout=False)
@@ -103,6 +129,70 @@ class TestEmitReceipt:
         assert len(receipts) >= 1
         assert receipts[-1]["test"] == "ledger"
 
+    def test_emit_receipt_after_external_replace(self):
+        """Appends should follow the ledger path when the file is replaced."""
+        import os
+        from src.shieldproof.core import LEDGER_PATH
+        emit_receipt("test", {"n": 1}, to_stdout=False)
+        tmp = f"{LEDGER_PATH}.new"
+        with open(tmp, "w") as f:
+            f.write(json.dumps({"receipt_type": "test", "n": 0}) + "\n")
+        os.replace(tmp, LEDGER_PATH)
+
+        emit_receipt("test", {"n": 2}, to_stdout=False)
+        assert [r["n"] for r in load_ledger()] == [0, 2]
+
+    def test_emit_receipt_quiet_by_default(self, capsys):
+        """emit_receipt should only print when asked to."""
+        from src.shieldproof.core import set_stdout_default
+        emit_receipt("test", {"n": 1})
+        assert capsys.readouterr().out == ""
+        set_stdout_default(True)
+        try:
+            r = emit_receipt("test", {"n": 2})
+        finally:
+            set_stdout_default(False)
+        assert json.loads(capsys.readouterr().out) == r
+
+    def test_emit_receipts_batch(self, capsys):
+        """Batch emission should match per-receipt ledger lines and stdout."""
+        from src.shieldproof.core import emit_receipts_batch
+        receipts = emit_receipts_batch(
+            [("test", {"n": i}) for i in range(3)], to_stdout=True
+        )
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == receipts
+        assert load_ledger() == receipts
+
+    def test_validate_receipt_hash_format(self):
+        """validate_receipt should accept only lowercase 64:64 hex hashes."""
+        from src.shieldproof.core import validate_receipt
+        r = emit_receipt("test", {"a": 1}, to_stdout=False, to_ledger=False)
+        assert validate_receipt(r)
+        sha, b3 = r["payload_hash"].split(":")
+        for bad in (sha.upper() + ":" + b3, sha + ":" + b3 + "\n", sha, 5):
+            assert not validate_receipt({**r, "payload_hash": bad})
+
+    def test_emit_receipt_unknown_format(self):
+        """emit_receipt should reject unknown output formats."""
+        with pytest.raises(ValueError):
+            emit_receipt("test", {"a": 1}, to_ledger=False, format="xml")
+
+    def test_ledger_line_is_stdlib_json(self):
+        """Ledger lines should be sorted-key stdlib JSON and round-trip."""
+        import src.shieldproof.core.receipt as receipt_mod
+        r = emit_receipt("test", {"name": "Société", "n": [1, 1e16, 2**70]}, to_stdout=False)
+        assert receipt_mod._dumps(r) == json.dumps(r, sort_keys=True)
+        assert load_ledger()[-1] == r
+
+    def test_emit_receipt_cbor_keeps_jsonl_ledger(self, capsysbinary):
+        """CBOR output should not change the JSONL ledger encoding."""
+        cbor2 = pytest.importorskip("cbor2")
+        r = emit_receipt("test", {"enc": "cbor"}, to_stdout=True, format="cbor")
+        out = capsysbinary.readouterr().out
+        assert cbor2.loads(out)["payload_hash"] == r["payload_hash"]
+        assert load_ledger()[-1]["enc"] == "cbor"
+
 
 class TestMerkle:
     """Tests for merkle function."""
@@ -129,6 +219,47 @@ class TestMerkle:
         m2 = merkle(items)
         assert m1 == m2
 
+    def test_merkle_matches_pairwise_definition(self):
+        """Root should equal dual_hash of concatenated child hashes, level by level."""
+        items = [{"a": 1}, "b", {"c": [3]}]
+        leaves = [dual_hash(json.dumps(items[0], sort_keys=True)),
+                  dual_hash("b"),
+                  dual_hash(json.dumps(items[2], sort_keys=True))]
+        left = dual_hash(leaves[0] + leaves[1])
+        right = dual_hash(leaves[2] + leaves[2])
+        assert merkle(items) == dual_hash(left + right)
+
+    def test_incremental_merkle_matches(self):
+        """IncrementalMerkle should give merkle()'s root after every append."""
+        from src.shieldproof.core import IncrementalMerkle
+        acc = IncrementalMerkle()
+        items = []
+        for i in range(13):
+            assert acc.root() == merkle(items)
+            item = {"i": i} if i % 2 else f"leaf{i}"
+            items.append(item)
+            acc.append(item)
+        assert len(acc) == 13
+
+    def test_merkle_parallel_matches(self):
+        """merkle_parallel should give merkle()'s root for uneven shards."""
+        from src.shieldproof.core import merkle_parallel
+        for n in (2, 5, 37):
+            items = [{"i": i} if i % 2 else f"leaf{i}" for i in range(n)]
+            assert merkle_parallel(items, workers=3) == merkle(items)
+
+    def test_anchor_batch_whole_ledger(self):
+        """anchor_batch() should anchor the current ledger incrementally."""
+        from src.shieldproof.core import anchor_batch
+        for i in range(3):
+            emit_receipt("test", {"i": i}, to_stdout=False)
+        first = anchor_batch()
+        assert first["merkle_root"] == merkle(load_ledger())
+        emit_receipt("test", {"i": 3}, to_stdout=False)
+        second = anchor_batch()
+        assert second["merkle_root"] == merkle(load_ledger())
+        assert second["batch_size"] == 4
+
     def test_merkle_order_matters(self):
         """merkle should produce different results for different order."""
         m1 = merkle([{"a": 1}, {"b": 2}])
@@ -139,6 +270,34 @@ class TestMerkle:
 class TestQueryReceipts:
     """Tests for query_receipts function."""
 
+    def test_reads_return_copies(self):
+        """Mutating returned receipts should not change later reads."""
+        from src.shieldproof.core import get_by_id, get_by_type, get_latest_by_field
+        r = emit_receipt("contract", {"contract_id": "C-1", "amount": 1}, to_stdout=False)
+        load_ledger()[0]["amount"] = 999
+        query_receipts("contract")[0]["amount"] = 999
+        get_by_type("contract")[0]["amount"] = 999
+        get_by_id(r["payload_hash"])["amount"] = 999
+        get_latest_by_field("contract_id", "C-1")["amount"] = 999
+        assert load_ledger()[0]["amount"] == 1
+        assert query_receipts("contract", contract_id="C-1")[0]["amount"] == 1
+
+    def test_reads_copy_nested_values(self):
+        """Nested lists in returned receipts should not be shared with the cache."""
+        from src.shieldproof.core import get_by_id
+        r = emit_receipt("contract", {"milestones": [{"id": "M1"}]}, to_stdout=False)
+        load_ledger()[0]["milestones"].append({"id": "M2"})
+        get_by_id(r["payload_hash"])["milestones"][0]["id"] = "X"
+        assert query_receipts("contract")[0]["milestones"] == [{"id": "M1"}]
+
+    def test_cached_receipts_share_repeated_values(self):
+        """Repeated type and ID strings should be one object in the cache."""
+        for i in range(2):
+            emit_receipt("milestone", {"contract_id": "C-1", "i": i}, to_stdout=False)
+        first, second = load_ledger()
+        assert first["receipt_type"] is second["receipt_type"]
+        assert first["contract_id"] is second["contract_id"]
+
     def test_query_receipts_empty(self):
         """query_receipts should return empty list for empty ledger."""
         receipts = query_receipts()
@@ -163,6 +322,119 @@ class TestQueryReceipts:
         assert len(filtered) == 1
         assert filtered[0]["key"] == "value1"
 
+    def test_query_receipts_sees_new_writes(self):
+        """query_receipts should reflect receipts appended after a read."""
+        emit_receipt("test", {"key": "first"}, to_stdout=False)
+        assert len(query_receipts("test")) == 1
+
+        emit_receipt("test", {"key": "second"}, to_stdout=False)
+        assert len(query_receipts("test")) == 2
+
+        clear_ledger()
+        assert query_receipts("test") == []
+
+    def test_query_receipts_defers_partial_line(self):
+        """A half-written trailing line should be read once it completes."""
+        from src.shieldproof.core import LEDGER_PATH
+        emit_receipt("test", {"key": "first"}, to_stdout=False)
+        line = json.dumps({"receipt_type": "test", "key": "second"})
+        with open(LEDGER_PATH, "a") as f:
+            f.write(line[:10])
+        assert len(query_receipts("test")) == 1
+
+        with open(LEDGER_PATH, "a") as f:
+            f.write(line[10:] + "\n")
+        assert [r["key"] for r in query_receipts("test")] == ["first", "second"]
+
+    def test_query_receipts_sees_rewrite(self):
+        """A truncated and rewritten ledger should be re-parsed in full."""
+        from src.shieldproof.core import LEDGER_PATH, invalidate_cache
+        emit_receipt("test", {"key": "old"}, to_stdout=False)
+        emit_receipt("test", {"key": "old"}, to_stdout=False)
+        assert len(query_receipts("test")) == 2
+
+        with open(LEDGER_PATH, "w") as f:
+            f.write(json.dumps({"receipt_type": "test", "key": "new"}) + "\n")
+        assert [r["key"] for r in query_receipts("test")] == ["new"]
+
+        invalidate_cache()
+        assert [r["key"] for r in query_receipts("test")] == ["new"]
+
+    def test_query_receipts_sees_grown_rewrite(self):
+        """A same-inode rewrite that ends up larger should be re-parsed in full."""
+        from src.shieldproof.core import LEDGER_PATH
+        emit_receipt("test", {"key": "old"}, to_stdout=False)
+        assert [r["key"] for r in query_receipts("test")] == ["old"]
+
+        size = Path(LEDGER_PATH).stat().st_size
+        keys = [f"new-{i}" for i in range(size // 20)]
+        with open(LEDGER_PATH, "r+") as f:
+            f.write("".join(json.dumps({"receipt_type": "test", "key": k}) + "\n" for k in keys))
+        assert Path(LEDGER_PATH).stat().st_size > size
+        assert [r["key"] for r in query_receipts("test")] == keys
+
+    def test_query_receipts_indexed_matches_scan(self):
+        """Indexed filters should return the same receipts, in ledger order."""
+        for i in range(6):
+            emit_receipt("milestone" if i % 2 else "contract", {
+                "contract_id": f"C-{i % 3}",
+                "milestone_id": f"M{i % 2}",
+                "status": "PENDING" if i < 3 else "PAID",
+            }, to_stdout=False)
+        ledger = load_ledger()
+        cases = [
+            ("milestone", {"contract_id": "C-1"}),
+            ("contract", {"contract_id": "C-0", "milestone_id": "M0"}),
+            (None, {"milestone_id": "M1", "status": "PAID"}),
+            (None, {"contract_id": ["C-1"]}),
+            ("contract", {"status": None}),
+            ("missing", {}),
+        ]
+        for receipt_type, filters in cases:
+            expected = [
+                r for r in ledger
+                if (not receipt_type or r["receipt_type"] == receipt_type)
+                and all(r.get(k) == v for k, v in filters.items())
+            ]
+            assert query_receipts(receipt_type, **filters) == expected
+
+    def test_distinct_values_tracks_appends(self):
+        """distinct_values should pick up receipts emitted after a read."""
+        from src.shieldproof.core import distinct_values
+        emit_receipt("contract", {"contract_id": "C-1"}, to_stdout=False)
+        emit_receipt("milestone", {"contract_id": "C-9"}, to_stdout=False)
+        assert distinct_values("contract", "contract_id") == {"C-1"}
+
+        emit_receipt("contract", {"contract_id": "C-2"}, to_stdout=False)
+        assert distinct_values("contract", "contract_id") == {"C-1", "C-2"}
+
+    def test_get_latest_by_field(self):
+        """get_latest_by_field should return the newest matching receipt."""
+        from src.shieldproof.core import get_latest_by_field
+        emit_receipt("contract", {"contract_id": "C-1", "v": 1}, to_stdout=False)
+        emit_receipt("contract", {"contract_id": "C-1", "v": 2}, to_stdout=False)
+        emit_receipt("milestone", {"contract_id": "C-1", "v": 3}, to_stdout=False)
+        assert get_latest_by_field("contract_id", "C-1", "contract")["v"] == 2
+        assert get_latest_by_field("contract_id", "C-1")["v"] == 3
+        assert get_latest_by_field("v", 1)["v"] == 1
+        assert get_latest_by_field("contract_id", "C-2") is None
+
+    def test_get_by_id_first_match(self):
+        """get_by_id should return the first receipt matching either id field."""
+        from src.shieldproof.core import get_by_id
+        first = emit_receipt("test", {"receipt_id": "R-1"}, to_stdout=False)
+        emit_receipt("test", {"receipt_id": "R-1", "n": 2}, to_stdout=False)
+        assert get_by_id("R-1") == first
+        assert get_by_id(first["payload_hash"]) == first
+        assert get_by_id("R-404") is None
+
+    def test_load_ledger_returns_copy(self):
+        """Mutating a returned list should not affect later reads."""
+        emit_receipt("test", {"key": "value"}, to_stdout=False)
+        load_ledger().clear()
+        query_receipts().clear()
+        assert len(load_ledger()) == 1
+
 
 class TestConstants:
     """Tests for module constants."""
@@ -209,3 +481,41 @@ class TestStopRule:
             raise StopRule("test message")
         except StopRule as e:
             assert "test message" in str(e)
+
+
+class TestGateCache:
+    """Tests for cached gate checks."""
+
+    def test_gate_cached_until_forced(self, tmp_path):
+        """Gate results should be reused until force re-runs them."""
+        from src.shieldproof.core import check_t2h, gate_status
+
+        def spec_passed(result):
+            return next(c for c in result["checks"] if c["name"] == "spec.md exists")["passed"]
+
+        first = check_t2h(str(tmp_path))
+        assert not spec_passed(first)
+        first["checks"].clear()  # Callers get copies
+
+        (tmp_path / "spec.md").write_text("spec")
+        assert not spec_passed(gate_status("t2h", str(tmp_path)))
+        assert spec_passed(gate_status("t2h", str(tmp_path), force=True))
+
+
+class TestPackageExports:
+    """Tests for the lazily loaded package namespace."""
+
+    def test_all_names_resolve(self):
+        """Every name in __all__ should resolve from its submodule."""
+        import src.shieldproof as shieldproof
+        from src.shieldproof.contract import register_contract
+
+        assert shieldproof.register_contract is register_contract
+        for name in shieldproof.__all__:
+            assert getattr(shieldproof, name) is not None
+
+    def test_unknown_attribute(self):
+        """Unknown names should raise AttributeError."""
+        import src.shieldproof as shieldproof
+        with pytest.raises(AttributeError):
+            shieldproof.not_a_real_name